@@ -27,6 +27,7 @@ class GalleryWallApp:
         self.file_manager: Optional[FileManager] = None
         self.current_wall: Optional[Wall] = None
         self.artworks: List[Artwork] = []
+        self.artworks_by_id: Dict[str, Artwork] = {}  # art_id -> Artwork index
         self.artwork_images: Dict[str, any] = {}  # art_id -> numpy array
         self.workspaces: List[Workspace] = []
         self.current_workspace: Optional[Workspace] = None
@@ -124,6 +125,7 @@ class GalleryWallApp:
         # Load artworks
         if 'artworks' in project_data:
             self.artworks = [Artwork.from_dict(a) for a in project_data['artworks']]
+            self.rebuild_artwork_index()
 
         # Load workspaces
         if 'workspaces' in project_data:
@@ -131,6 +133,10 @@ class GalleryWallApp:
             if len(self.workspaces) > 0:
                 self.current_workspace = self.workspaces[0]
 
+    def rebuild_artwork_index(self):
+        """Rebuild the art_id -> Artwork index after the artwork list changes"""
+        self.artworks_by_id = {a.art_id: a for a in self.artworks}
+
     def save_project(self):
         """Save current project"""
         if not self.file_manager:
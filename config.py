@@ -10,9 +10,10 @@ DEFAULT_PROJECT_NAME = "Untitled Gallery"
 # Canvas settings
 DEFAULT_CANVAS_WIDTH = 1200
 DEFAULT_CANVAS_HEIGHT = 800
-MIN_ZOOM = 0.1
-MAX_ZOOM = 5.0
-ZOOM_STEP = 0.1
+ZOOM_LEVELS = [0.25, 0.33, 0.5, 0.67, 0.75, 1.0, 1.25, 1.5, 2.0, 3.0, 4.0]  # Discrete zoom steps
+
+# Units
+CM_TO_INCH = 1.0 / 2.54
 
 # Grid settings
 DEFAULT_GRID_SPACING_CM = 10.0
@@ -29,6 +30,8 @@ DEFAULT_SNAP_TOLERANCE_PX = 10
 
 # Rendering settings
 THUMBNAIL_SIZE = 200
+EDIT_PREVIEW_MAX_SIZE = 2000  # Longest side of the working image for live editor previews
+FRAME_CACHE_SIZE = 200  # Rendered workspace frames kept across zoom levels and resizes
 WORKSPACE_PREVIEW_QUALITY = "MEDIUM"  # DRAFT, MEDIUM, HIGH
 EXPORT_QUALITY = "HIGH"
 CACHE_ENABLED = True
@@ -6,6 +6,7 @@ from typing import Optional, List, Tuple, Dict
 from datetime import datetime
 import numpy as np
 from models.frame import FrameConfig
+import config
 
 
 @dataclass
@@ -47,8 +48,8 @@ class Artwork:
         """Update dimensions given cm values, auto-convert to inches"""
         self.real_width_cm = width_cm
         self.real_height_cm = height_cm
-        self.real_width_inches = width_cm / 2.54
-        self.real_height_inches = height_cm / 2.54
+        self.real_width_inches = width_cm * config.CM_TO_INCH
+        self.real_height_inches = height_cm * config.CM_TO_INCH
         self.modified_date = datetime.now().isoformat()
 
     def update_dimensions_from_inches(self, width_inches: float, height_inches: float):
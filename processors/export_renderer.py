@@ -58,8 +58,7 @@ class ExportRenderer:
             elif wall.type == "photo" and wall.corrected_image is not None:
                 # Photo background - resize to fit
                 from processors.image_processor import ImageProcessor
-                wall_img = ImageProcessor.numpy_to_pil(wall.corrected_image)
-                wall_img = wall_img.resize((output_width, output_height), Image.LANCZOS)
+                wall_img = ImageProcessor.resize_to_pil(wall.corrected_image, (output_width, output_height))
                 canvas.paste(wall_img, (0, 0))
 
             # Render each placed artwork (sorted by z-index)
@@ -86,10 +85,9 @@ class ExportRenderer:
                 else:
                     # No frame, just artwork
                     from processors.image_processor import ImageProcessor
-                    art_pil = ImageProcessor.numpy_to_pil(artwork_image)
                     art_width_px = real_to_pixels(artwork.real_width_cm, scale)
                     art_height_px = real_to_pixels(artwork.real_height_cm, scale)
-                    framed = art_pil.resize((art_width_px, art_height_px), Image.LANCZOS)
+                    framed = ImageProcessor.resize_to_pil(artwork_image, (art_width_px, art_height_px))
                     framed = framed.convert('RGBA')
 
                 # Calculate position in pixels
@@ -32,16 +32,13 @@ class FrameRenderer:
         Returns:
             Framed artwork as PIL Image (RGBA)
         """
-        # Convert artwork to PIL RGB
-        from processors.image_processor import ImageProcessor
-        artwork_pil = ImageProcessor.numpy_to_pil(artwork_image)
-
         # Calculate artwork dimensions in pixels
         art_width_px = real_to_pixels(artwork_width_cm, scale)
         art_height_px = real_to_pixels(artwork_height_cm, scale)
 
-        # Resize artwork to correct pixel dimensions
-        artwork_pil = artwork_pil.resize((art_width_px, art_height_px), Image.LANCZOS)
+        # Resize artwork to correct pixel dimensions, then convert to PIL RGB
+        from processors.image_processor import ImageProcessor
+        artwork_pil = ImageProcessor.resize_to_pil(artwork_image, (art_width_px, art_height_px))
 
         # Build layers from inside out
         current_layer = artwork_pil.convert('RGBA')
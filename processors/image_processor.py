@@ -24,10 +24,12 @@ class ImageProcessor:
         try:
             img = cv2.imread(file_path)
             if img is None:
-                # Try with PIL
-                pil_img = Image.open(file_path)
-                img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
-            return img
+                # Try with PIL, normalizing palette, alpha and 16-bit modes to 8-bit RGB
+                pil_img = Image.open(file_path).convert('RGB')
+                img = cv2.cvtColor(np.asarray(pil_img), cv2.COLOR_RGB2BGR)
+
+            # Every later stage works on contiguous 8-bit BGR
+            return np.ascontiguousarray(img, dtype=np.uint8)
         except Exception as e:
             print(f"Error loading image: {e}")
             return None
@@ -78,6 +80,37 @@ class ImageProcessor:
         resized = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_LANCZOS4)
         return resized
 
+    @staticmethod
+    def make_thumbnail(image: np.ndarray, size: int) -> Image.Image:
+        """
+        Create a small RGB thumbnail maintaining aspect ratio
+
+        The image is shrunk with area averaging before any color conversion,
+        so only the thumbnail-sized result is converted to PIL. Large
+        reductions first shrink by a whole factor, which OpenCV averages
+        with its fast integer path, then finish at the exact size.
+
+        Args:
+            image: Input image (BGR)
+            size: Maximum thumbnail dimension
+
+        Returns:
+            Thumbnail as PIL Image (RGB)
+        """
+        height, width = image.shape[:2]
+        factor = size / max(height, width)
+        if factor < 1:
+            new_size = (max(1, round(width * factor)), max(1, round(height * factor)))
+
+            # Stay within 2x of the target so the final pass still averages every pixel
+            step = min(int(1 / (2 * factor)), width, height)
+            if step >= 2:
+                image = image[:height - height % step, :width - width % step]
+                image = cv2.resize(image, (width // step, height // step), interpolation=cv2.INTER_AREA)
+
+            image = cv2.resize(image, new_size, interpolation=cv2.INTER_AREA)
+        return ImageProcessor.numpy_to_pil(image)
+
     @staticmethod
     def crop_image(image: np.ndarray, crop_box: Tuple[int, int, int, int]) -> np.ndarray:
         """
@@ -217,6 +250,27 @@ class ImageProcessor:
         rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
         return Image.fromarray(rgb)
 
+    @staticmethod
+    def resize_to_pil(image: np.ndarray, size: Tuple[int, int]) -> Image.Image:
+        """
+        Resize a numpy array (BGR) and convert it to a PIL Image (RGB)
+
+        The resize happens first, so only output-sized pixels are color
+        converted instead of the full-resolution artwork.
+
+        Args:
+            image: Input image (BGR)
+            size: Output (width, height) in pixels
+
+        Returns:
+            Resized image as PIL Image (RGB)
+        """
+        width, height = max(1, size[0]), max(1, size[1])
+        shrinking = width <= image.shape[1] and height <= image.shape[0]
+        interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_LANCZOS4
+        resized = cv2.resize(image, (width, height), interpolation=interpolation)
+        return ImageProcessor.numpy_to_pil(resized)
+
     @staticmethod
     def pil_to_numpy(image: Image.Image) -> np.ndarray:
         """Convert PIL Image (RGB) to numpy array (BGR)"""
@@ -0,0 +1,51 @@
+"""
+JPEG File Size Estimation
+"""
+import math
+
+# Bits per pixel follow bpp = BPP_SCALE * exp(BPP_RATE * quality), fitted to
+# typical photographic content at 4:2:0 (~0.3 bpp at q10, ~4 bpp at q95)
+BPP_SCALE = 0.22
+BPP_RATE = 0.0305
+HEADER_BYTES = 600  # Markers, quantization and Huffman tables
+
+
+def predict_bytes(width: int, height: int, quality: int) -> float:
+    """
+    Estimate the size of a JPEG export
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        quality: JPEG quality (1-100)
+
+    Returns:
+        Estimated file size in bytes
+    """
+    bpp = BPP_SCALE * math.exp(BPP_RATE * quality)
+    return width * height * bpp / 8 + HEADER_BYTES
+
+
+def quality_for_size(width: int, height: int, target_bytes: float,
+                     min_quality: int = 1, max_quality: int = 100) -> int:
+    """
+    Solve for the JPEG quality that gives a target file size
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        target_bytes: Desired file size in bytes
+        min_quality: Lowest quality to return
+        max_quality: Highest quality to return
+
+    Returns:
+        Quality clamped to [min_quality, max_quality]
+    """
+    pixels = width * height
+    payload = target_bytes - HEADER_BYTES
+    if pixels <= 0 or payload <= 0:
+        return min_quality
+
+    bpp = payload * 8 / pixels
+    quality = math.log(bpp / BPP_SCALE) / BPP_RATE
+    return int(max(min_quality, min(max_quality, round(quality))))
@@ -6,14 +6,46 @@ from tkinter import Canvas, filedialog
 from PIL import Image, ImageTk, ImageDraw, ImageFont
 import numpy as np
 from pathlib import Path
+from collections import OrderedDict
 from models.workspace import Workspace, PlacedArtwork
+from models.frame import FrameConfig, MatConfig
 from processors.frame_renderer import FrameRenderer
 from processors.export_renderer import ExportRenderer
+from processors import jpeg_size
 from utils.measurements import calculate_scale_factor, real_to_pixels, pixels_to_real
 from utils.file_manager import FileManager
 from utils.undo_manager import UndoManager, Command
+from utils import geometry
+from utils.spatial_index import QuadTree
 import config
-import copy
+import functools
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _frame_key(frame_config):
+    """Hashable key of the frame fields that affect total dimensions"""
+    if not frame_config:
+        return None
+    mat = frame_config.mat
+    mat_key = (mat.top_width_cm, mat.bottom_width_cm, mat.left_width_cm, mat.right_width_cm) if mat else None
+    return (frame_config.frame_width_cm, mat_key)
+
+
+def _frame_from_key(frame_key):
+    """Rebuild a FrameConfig with the dimension fields from a frame key"""
+    if frame_key is None:
+        return None
+    frame_width_cm, mat_key = frame_key
+    mat = MatConfig(*mat_key, color="#FFFFFF") if mat_key else None
+    return FrameConfig(mat=mat, frame_width_cm=frame_width_cm)
+
+
+@functools.lru_cache(maxsize=512)
+def _total_dims(real_width_cm: float, real_height_cm: float, frame_key):
+    """Cached FrameRenderer.calculate_total_dimensions keyed on artwork size and frame key"""
+    return FrameRenderer.calculate_total_dimensions(real_width_cm, real_height_cm, _frame_from_key(frame_key))
 
 
 class ArrangementWorkspaceScreen:
@@ -42,13 +74,36 @@ class ArrangementWorkspaceScreen:
         self.pan_offset_x = 20
         self.pan_offset_y = 20
         self.space_pressed = False
+        self._render_pending = False  # True while a coalesced render is queued
+        self._sel_info_dirty = False  # Selection info label needs a refresh
+        self._undo_btn_dirty = False  # Undo/redo buttons need a refresh
 
         self.canvas_items = {}  # id(placed_artwork) -> (canvas_id, photo) mapping
-        self.rendered_frames = {}  # cache key -> PIL Image
+        self._id_to_placed = {}  # canvas_id -> PlacedArtwork, reverse of canvas_items
+        self._placed_bounds_px = {}  # id(placed_artwork) -> (x0, y0, x1, y1) canvas pixels from last render
+        self.rendered_frames = OrderedDict()  # cache key (art_id + scale) -> PIL Image, least recently used first
+        self._frames_lock = threading.Lock()  # guards rendered_frames against the warm-up pool
+        self._selected_frames = {}  # id(selected placed) -> (frame cache key, highlighted PIL Image); UI thread only
+        self._frame_pool = ThreadPoolExecutor(max_workers=2)
         self.selected_placed = []  # List of selected PlacedArtwork (for multi-select)
+        self._selected_ids = set()  # id() of each selected PlacedArtwork, for O(1) membership
+        self._selection_version = 0  # Bumped on every selection change
+        self._sel_overlay = {}  # (width, height) -> RGBA selection border overlay
+        self._selection_cache = []  # (placed, width_cm, height_cm) per selected artwork
+        self._selection_sizes = (np.empty(0), np.empty(0))  # widths, heights of the cached selection
+        self._selection_cache_key = None
+        self._hit_index = None  # QuadTree of placed artwork bounds in cm
+        self._hit_index_dirty = True
+
+        # Wall photo cache (source array -> PIL image -> Tk image at current size)
+        self._wall_photo_source = None
+        self._wall_photo_ref = None
+        self._wall_photo_size = None
+        self.wall_photo_tk = None
 
         # Guidelines
         self.guidelines = []  # List of (orientation, position) tuples
+        self._guide_arrays = None  # Cached (horizontal, vertical) position arrays for snapping
         self.dragging_guideline = None
 
         # Settings
@@ -70,9 +125,20 @@ class ArrangementWorkspaceScreen:
             )
             self.app.workspaces.append(self.app.current_workspace)
 
+        # Placements sorted topmost first, for drawing and hit-testing
+        self._placed_by_z_desc = []
+        self._z_rank = {}  # id(placed_artwork) -> position in _placed_by_z_desc
+        self._z_order_dirty = True
+
+        # Running z_index bounds; deletions may leave them wider than needed, which is harmless
+        self._reset_z_range()
+
         self._setup_ui()
         self._bind_keyboard_shortcuts()
 
+        # Pre-render library frames off the UI thread once the canvas has its real size
+        self.canvas.after_idle(self._warm_frame_cache)
+
     def _setup_ui(self):
         """Set up the UI"""
         main_frame = ctk.CTkFrame(self.parent)
@@ -249,6 +315,7 @@ class ArrangementWorkspaceScreen:
             width=170
         )
         self.workspace_dropdown.pack(fill="x", padx=5, pady=2)
+        self._workspace_by_name = {w.name: w for w in reversed(self.app.workspaces)}  # first match wins on duplicate names
 
         # Workspace action buttons
         workspace_btn_frame = ctk.CTkFrame(workspace_frame)
@@ -405,41 +472,65 @@ class ArrangementWorkspaceScreen:
 
     def _bind_keyboard_shortcuts(self):
         """Bind keyboard shortcuts"""
-        # Undo/Redo
-        self.parent.bind_all("<Control-z>", lambda e: self._undo())
-        self.parent.bind_all("<Control-Z>", lambda e: self._undo())
-        self.parent.bind_all("<Control-y>", lambda e: self._redo())
-        self.parent.bind_all("<Control-Y>", lambda e: self._redo())
-        self.parent.bind_all("<Control-Shift-z>", lambda e: self._redo())
-        self.parent.bind_all("<Control-Shift-Z>", lambda e: self._redo())
-
-        # Save
-        self.parent.bind_all("<Control-s>", lambda e: self._save_project())
-        self.parent.bind_all("<Control-S>", lambda e: self._save_project())
-
-        # Delete
-        self.parent.bind_all("<Delete>", lambda e: self._delete_selected())
-        self.parent.bind_all("<BackSpace>", lambda e: self._delete_selected())
+        # Global shortcuts, keyed by modifiers + keysym (see _compose_key)
+        self._key_dispatch = {
+            # Undo/Redo
+            "Control-z": self._undo,
+            "Control-y": self._redo,
+            "Control-Shift-z": self._redo,
+            # Save
+            "Control-s": self._save_project,
+            # Delete
+            "Delete": self._delete_selected,
+            "BackSpace": self._delete_selected,
+            # Select all
+            "Control-a": self._select_all,
+            # Space for panning
+            "space": self._on_space_press,
+        }
 
-        # Select all
-        self.parent.bind_all("<Control-a>", lambda e: self._select_all())
-        self.parent.bind_all("<Control-A>", lambda e: self._select_all())
+        # Canvas-only shortcuts: arrow keys for nudging, Shift+Arrow for larger nudges
+        self._canvas_key_dispatch = {
+            "Left": lambda: self._nudge_selected(-1, 0),
+            "Right": lambda: self._nudge_selected(1, 0),
+            "Up": lambda: self._nudge_selected(0, -1),
+            "Down": lambda: self._nudge_selected(0, 1),
+            "Shift-Left": lambda: self._nudge_selected(-10, 0),
+            "Shift-Right": lambda: self._nudge_selected(10, 0),
+            "Shift-Up": lambda: self._nudge_selected(0, -10),
+            "Shift-Down": lambda: self._nudge_selected(0, 10),
+        }
 
-        # Space for panning
-        self.parent.bind_all("<KeyPress-space>", self._on_space_press)
+        self.parent.bind_all("<Key>", self._on_key)
         self.parent.bind_all("<KeyRelease-space>", self._on_space_release)
-
-        # Arrow keys for nudging
-        self.canvas.bind("<Left>", lambda e: self._nudge_selected(-1, 0))
-        self.canvas.bind("<Right>", lambda e: self._nudge_selected(1, 0))
-        self.canvas.bind("<Up>", lambda e: self._nudge_selected(0, -1))
-        self.canvas.bind("<Down>", lambda e: self._nudge_selected(0, 1))
-
-        # Shift+Arrow for larger nudges
-        self.canvas.bind("<Shift-Left>", lambda e: self._nudge_selected(-10, 0))
-        self.canvas.bind("<Shift-Right>", lambda e: self._nudge_selected(10, 0))
-        self.canvas.bind("<Shift-Up>", lambda e: self._nudge_selected(0, -10))
-        self.canvas.bind("<Shift-Down>", lambda e: self._nudge_selected(0, 10))
+        self.canvas.bind("<Key>", self._on_canvas_key)
+
+    @staticmethod
+    def _compose_key(event, with_shift: bool = True) -> str:
+        """Build a dispatch key like 'Control-Shift-z' from a key event"""
+        keysym = event.keysym.lower() if len(event.keysym) == 1 else event.keysym
+        modifiers = ""
+        if event.state & 0x0004:  # Control
+            modifiers += "Control-"
+        if with_shift and event.state & 0x0001:  # Shift
+            modifiers += "Shift-"
+        return modifiers + keysym
+
+    def _dispatch_key(self, dispatch: dict, event):
+        """Run the handler for a key event, ignoring Shift if there's no Shift binding"""
+        handler = dispatch.get(self._compose_key(event))
+        if handler is None and event.state & 0x0001:
+            handler = dispatch.get(self._compose_key(event, with_shift=False))
+        if handler is not None:
+            handler()
+
+    def _on_key(self, event):
+        """Handle global keyboard shortcuts"""
+        self._dispatch_key(self._key_dispatch, event)
+
+    def _on_canvas_key(self, event):
+        """Handle canvas keyboard shortcuts"""
+        self._dispatch_key(self._canvas_key_dispatch, event)
 
     def _add_artwork_to_workspace(self, artwork):
         """Add artwork to workspace at center"""
@@ -447,15 +538,7 @@ class ArrangementWorkspaceScreen:
             return
 
         # Calculate total dimensions including frame
-        total_width_cm = artwork.real_width_cm
-        total_height_cm = artwork.real_height_cm
-
-        if artwork.frame_config:
-            total_width_cm, total_height_cm = FrameRenderer.calculate_total_dimensions(
-                artwork.real_width_cm,
-                artwork.real_height_cm,
-                artwork.frame_config
-            )
+        total_width_cm, total_height_cm = self._get_total_dims(artwork)
 
         # Place at center of wall
         x = self.app.current_wall.real_width_cm / 2 - total_width_cm / 2
@@ -464,10 +547,12 @@ class ArrangementWorkspaceScreen:
         # Create command for undo
         def undo_add(data):
             self.app.current_workspace.remove_artwork(data['art_id'])
+            self._z_order_dirty = True
             self._render_workspace()
 
         def redo_add(data):
-            self.app.current_workspace.add_artwork(data['art_id'], data['x'], data['y'])
+            placed = self.app.current_workspace.add_artwork(data['art_id'], data['x'], data['y'])
+            self._track_z(placed)
             self._render_workspace()
 
         command = Command(
@@ -479,7 +564,18 @@ class ArrangementWorkspaceScreen:
         )
 
         self.undo_manager.execute(command)
-        self._update_undo_redo_buttons()
+        self._schedule_ui_refresh(undo=True)
+
+    def _get_artwork(self, art_id: str):
+        """Look up an artwork by id, returning None if it no longer exists"""
+        # Rebuild the app's index if the artwork list changed without updating it
+        if len(self.app.artworks_by_id) != len(self.app.artworks):
+            self.app.rebuild_artwork_index()
+        return self.app.artworks_by_id.get(art_id)
+
+    def _get_total_dims(self, artwork):
+        """Get cached (width_cm, height_cm) of an artwork including frame and mat"""
+        return _total_dims(artwork.real_width_cm, artwork.real_height_cm, _frame_key(artwork.frame_config))
 
     def _calculate_scale(self):
         """Calculate scale factor for current canvas size"""
@@ -501,6 +597,8 @@ class ArrangementWorkspaceScreen:
         # Clear canvas
         self.canvas.delete("all")
         self.canvas_items.clear()
+        self._id_to_placed.clear()
+        self._placed_bounds_px.clear()
 
         # Calculate scale
         self._calculate_scale()
@@ -535,37 +633,63 @@ class ArrangementWorkspaceScreen:
         # Render guidelines
         self._render_guidelines(offset_x, offset_y, wall_width_px, wall_height_px)
 
-        # Render placed artwork
-        for placed in self.app.current_workspace.placed_artworks:
+        # Render placed artwork, skipping pieces panned out of view
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+        if canvas_width <= 1:
+            canvas_width = config.DEFAULT_CANVAS_WIDTH
+        if canvas_height <= 1:
+            canvas_height = config.DEFAULT_CANVAS_HEIGHT
+
+        # Draw back to front so higher z_index pieces end up on top
+        for placed in reversed(self._get_placed_by_z_desc()):
+            if not self._is_in_viewport(placed, offset_x, offset_y, canvas_width, canvas_height):
+                continue
             self._render_placed_artwork(placed, offset_x, offset_y)
 
         # Render measurements if enabled
         if self.measurements_var.get():
             self._render_measurements(offset_x, offset_y)
 
+        # Placements may have moved; rebuild the hit-test index on next click
+        self._hit_index_dirty = True
+
+    def _schedule_render(self):
+        """Schedule a render on idle, coalescing repeated requests into one"""
+        if not self._render_pending:
+            self._render_pending = True
+            self.canvas.after_idle(self._do_render)
+
+    def _do_render(self):
+        """Run a scheduled render"""
+        self._render_pending = False
+        self._render_workspace()
+
     def _render_wall_photo(self, offset_x, offset_y, wall_width_px, wall_height_px):
         """Render wall photo as background"""
         try:
             import cv2
-            from PIL import Image, ImageTk
-
-            # Convert wall image to PIL
-            wall_img = cv2.cvtColor(self.app.current_wall.corrected_image, cv2.COLOR_BGR2RGB)
-            pil_img = Image.fromarray(wall_img)
 
-            # Resize to fit canvas dimensions
-            pil_img = pil_img.resize((int(wall_width_px), int(wall_height_px)), Image.Resampling.LANCZOS)
+            source = self.app.current_wall.corrected_image
 
-            # Store reference to prevent garbage collection
-            if not hasattr(self, 'wall_photo_tk'):
-                self.wall_photo_tk = {}
+            # Convert wall image to PIL once per wall image, not per render
+            if self._wall_photo_source is not source:
+                wall_img = cv2.cvtColor(source, cv2.COLOR_BGR2RGB)
+                self._wall_photo_ref = Image.fromarray(wall_img)
+                self._wall_photo_source = source
+                self._wall_photo_size = None
 
-            self.wall_photo_tk[self.zoom] = ImageTk.PhotoImage(pil_img)
+            # Only rebuild the Tk image when the on-screen size changes
+            size = (int(wall_width_px), int(wall_height_px))
+            if self._wall_photo_size != size:
+                pil_img = self._wall_photo_ref.resize(size, Image.Resampling.LANCZOS)
+                self.wall_photo_tk = ImageTk.PhotoImage(pil_img)
+                self._wall_photo_size = size
 
             # Create image on canvas
             self.canvas.create_image(
                 offset_x, offset_y,
-                image=self.wall_photo_tk[self.zoom],
+                image=self.wall_photo_tk,
                 anchor="nw",
                 tags="wall"
             )
@@ -648,16 +772,12 @@ class ArrangementWorkspaceScreen:
         # Show spacing between selected artwork and edges/other pieces
         if len(self.selected_placed) > 0:
             for placed in self.selected_placed:
-                artwork = next((a for a in self.app.artworks if a.art_id == placed.artwork_id), None)
+                artwork = self._get_artwork(placed.artwork_id)
                 if not artwork:
                     continue
 
                 # Get artwork dimensions
-                width_cm, height_cm = FrameRenderer.calculate_total_dimensions(
-                    artwork.real_width_cm,
-                    artwork.real_height_cm,
-                    artwork.frame_config
-                )
+                width_cm, height_cm = self._get_total_dims(artwork)
 
                 x1_cm = placed.x
                 y1_cm = placed.y
@@ -680,22 +800,45 @@ class ArrangementWorkspaceScreen:
 
     def _draw_measurement_line(self, x1, y1, x2, y2, text):
         """Draw a measurement line with text"""
-        # Draw line
-        self.canvas.create_line(x1, y1, x2, y2, fill="#FF6B6B", width=1, tags="measurement")
-
-        # Draw end markers
-        self.canvas.create_line(x1-3, y1-3, x1+3, y1+3, fill="#FF6B6B", width=1, tags="measurement")
-        self.canvas.create_line(x1-3, y1+3, x1+3, y1-3, fill="#FF6B6B", width=1, tags="measurement")
-        self.canvas.create_line(x2-3, y2-3, x2+3, y2+3, fill="#FF6B6B", width=1, tags="measurement")
-        self.canvas.create_line(x2-3, y2+3, x2+3, y2-3, fill="#FF6B6B", width=1, tags="measurement")
+        # Draw line and both X end markers as a single polyline, retracing
+        # through each end point so the markers join the line seamlessly
+        coords = [
+            x1 - 3, y1 - 3, x1 + 3, y1 + 3, x1, y1,
+            x1 - 3, y1 + 3, x1 + 3, y1 - 3, x1, y1,
+            x2, y2,
+            x2 - 3, y2 - 3, x2 + 3, y2 + 3, x2, y2,
+            x2 - 3, y2 + 3, x2 + 3, y2 - 3
+        ]
+        self.canvas.create_line(*coords, fill="#FF6B6B", width=1, tags="measurement")
 
         # Draw text
         cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
         self.canvas.create_text(cx, cy - 10, text=text, fill="#FF6B6B", font=("Arial", 9, "bold"), tags="measurement")
 
+    def _is_in_viewport(self, placed: PlacedArtwork, offset_x: int, offset_y: int,
+                        canvas_width: int, canvas_height: int) -> bool:
+        """Check whether a placed artwork's on-screen bounds intersect the canvas"""
+        artwork = self._get_artwork(placed.artwork_id)
+        if not artwork:
+            return False
+
+        width_cm, height_cm = self._get_total_dims(artwork)
+
+        # Drop shadows extend the rendered image right/down by a fixed pixel margin
+        shadow_px = 0
+        if artwork.frame_config and artwork.frame_config.frame_shadow_enabled:
+            shadow_px = int(artwork.frame_config.frame_shadow_blur * 4)
+
+        x_px = offset_x + real_to_pixels(placed.x, self.scale)
+        y_px = offset_y + real_to_pixels(placed.y, self.scale)
+        w_px = real_to_pixels(width_cm, self.scale) + shadow_px
+        h_px = real_to_pixels(height_cm, self.scale) + shadow_px
+
+        return x_px < canvas_width and y_px < canvas_height and x_px + w_px > 0 and y_px + h_px > 0
+
     def _render_placed_artwork(self, placed: PlacedArtwork, offset_x: int, offset_y: int):
         """Render a placed artwork on canvas"""
-        artwork = next((a for a in self.app.artworks if a.art_id == placed.artwork_id), None)
+        artwork = self._get_artwork(placed.artwork_id)
         if not artwork:
             return
 
@@ -704,38 +847,22 @@ class ArrangementWorkspaceScreen:
             return
 
         # Render framed artwork if not cached
-        cache_key = f"{placed.artwork_id}_{self.zoom:.2f}"
-        if cache_key not in self.rendered_frames:
-            if artwork.frame_config:
-                framed = FrameRenderer.render_framed_artwork(
-                    artwork_image,
-                    artwork.real_width_cm,
-                    artwork.real_height_cm,
-                    artwork.frame_config,
-                    self.scale
-                )
-            else:
-                # No frame, just artwork
-                from processors.image_processor import ImageProcessor
-                art_pil = ImageProcessor.numpy_to_pil(artwork_image)
-                art_width_px = real_to_pixels(artwork.real_width_cm, self.scale)
-                art_height_px = real_to_pixels(artwork.real_height_cm, self.scale)
-                framed = art_pil.resize((art_width_px, art_height_px), Image.LANCZOS)
-
-            self.rendered_frames[cache_key] = framed
-
-        framed_img = self.rendered_frames[cache_key]
+        cache_key = f"{placed.artwork_id}_{self.scale:.4f}"
+        framed_img = self._cached_frame(cache_key)
+        if framed_img is None:
+            framed_img = self._render_frame_image(artwork, artwork_image, self.scale)
+            self._cache_frame(cache_key, framed_img)
 
         # Add selection highlight if selected
-        if placed in self.selected_placed:
-            # Create a copy with selection border
-            highlighted = framed_img.copy()
-            draw = ImageDraw.Draw(highlighted)
-            w, h = highlighted.size
-            # Draw thick selection border
-            for i in range(4):
-                draw.rectangle([i, i, w-1-i, h-1-i], outline="#2196F3", width=1)
-            framed_img = highlighted
+        if id(placed) in self._selected_ids:
+            # One highlighted copy per selected placement, rebuilt when its frame changes
+            cached = self._selected_frames.get(id(placed))
+            if cached is None or cached[0] != cache_key:
+                highlighted = framed_img.copy()
+                highlighted.alpha_composite(self._get_selection_overlay(highlighted.size))
+                cached = (cache_key, highlighted)
+                self._selected_frames[id(placed)] = cached
+            framed_img = cached[1]
 
         # Convert to PhotoImage
         photo = ImageTk.PhotoImage(framed_img)
@@ -754,6 +881,112 @@ class ArrangementWorkspaceScreen:
 
         # Store reference to prevent garbage collection
         self.canvas_items[id(placed)] = (item_id, photo)
+        self._id_to_placed[item_id] = placed
+
+        # Remember on-screen bounds (without drop shadow) for hit-testing
+        width_cm, height_cm = self._get_total_dims(artwork)
+        self._placed_bounds_px[id(placed)] = (
+            x_px, y_px,
+            x_px + real_to_pixels(width_cm, self.scale),
+            y_px + real_to_pixels(height_cm, self.scale)
+        )
+
+    def _cached_frame(self, cache_key: str):
+        """Get a rendered frame from the cache and mark it recently used, or None"""
+        with self._frames_lock:
+            framed_img = self.rendered_frames.get(cache_key)
+            if framed_img is not None:
+                self.rendered_frames.move_to_end(cache_key)
+            return framed_img
+
+    def _cache_frame(self, cache_key: str, framed_img: Image.Image):
+        """Store a rendered frame, evicting the least recently used beyond config.FRAME_CACHE_SIZE"""
+        with self._frames_lock:
+            self.rendered_frames[cache_key] = framed_img
+            self.rendered_frames.move_to_end(cache_key)
+            while len(self.rendered_frames) > config.FRAME_CACHE_SIZE:
+                self.rendered_frames.popitem(last=False)
+
+    @staticmethod
+    def _render_frame_image(artwork, artwork_image, scale: float) -> Image.Image:
+        """Render an artwork (framed or bare) as an RGBA image at the given scale"""
+        if artwork.frame_config:
+            return FrameRenderer.render_framed_artwork(
+                artwork_image,
+                artwork.real_width_cm,
+                artwork.real_height_cm,
+                artwork.frame_config,
+                scale
+            )
+
+        # No frame, just artwork
+        from processors.image_processor import ImageProcessor
+        art_width_px = real_to_pixels(artwork.real_width_cm, scale)
+        art_height_px = real_to_pixels(artwork.real_height_cm, scale)
+        return ImageProcessor.resize_to_pil(artwork_image, (art_width_px, art_height_px)).convert('RGBA')
+
+    def _warm_frame_cache(self):
+        """Render frames for the artwork library at the current scale in the background"""
+        if not self.app.current_wall:
+            return
+
+        self._calculate_scale()
+        scale = self.scale
+
+        for artwork in self.app.artworks:
+            artwork_image = self.app.artwork_images.get(artwork.art_id)
+            if artwork_image is None:
+                continue
+
+            cache_key = f"{artwork.art_id}_{scale:.4f}"
+            with self._frames_lock:
+                if cache_key in self.rendered_frames:
+                    continue
+
+            self._frame_pool.submit(self._warm_frame, cache_key, artwork, artwork_image, scale)
+
+    def _warm_frame(self, cache_key: str, artwork, artwork_image, scale: float):
+        """Render one frame on a worker thread and store it in the cache"""
+        try:
+            framed = self._render_frame_image(artwork, artwork_image, scale)
+            self._cache_frame(cache_key, framed)
+        except Exception as e:
+            print(f"Error pre-rendering frame: {e}")
+
+    def _hit_test(self, x_px: int, y_px: int):
+        """Get the topmost placed artwork under a canvas point, or None"""
+        if self._hit_index_dirty or self._hit_index is None:
+            wall = self.app.current_wall
+            self._hit_index = QuadTree(0, 0, wall.real_width_cm, wall.real_height_cm)
+            for placed in self.app.current_workspace.placed_artworks:
+                width_cm, height_cm = self._get_placed_dims(placed)
+                self._hit_index.insert(placed, placed.x, placed.y, placed.x + width_cm, placed.y + height_cm)
+            self._hit_index_dirty = False
+
+        # Coarse query in wall cm, then exact test against the rendered pixel bounds
+        cm_x = pixels_to_real(x_px - self.pan_offset_x, self.scale)
+        cm_y = pixels_to_real(y_px - self.pan_offset_y, self.scale)
+
+        hits = []
+        for placed in self._hit_index.query_point(cm_x, cm_y):
+            bounds = self._placed_bounds_px.get(id(placed))
+            if bounds and bounds[0] <= x_px <= bounds[2] and bounds[1] <= y_px <= bounds[3]:
+                hits.append(placed)
+
+        if not hits:
+            return None
+        self._get_placed_by_z_desc()
+        return min(hits, key=lambda p: self._z_rank[id(p)])
+
+    def _get_selection_overlay(self, size):
+        """Get the cached selection border overlay for an image size"""
+        overlay = self._sel_overlay.get(size)
+        if overlay is None:
+            w, h = size
+            overlay = Image.new('RGBA', size, (0, 0, 0, 0))
+            ImageDraw.Draw(overlay).rectangle([0, 0, w - 1, h - 1], outline="#2196F3", width=4)
+            self._sel_overlay[size] = overlay
+        return overlay
 
     def _on_canvas_click(self, event):
         """Handle canvas click"""
@@ -775,81 +1008,30 @@ class ArrangementWorkspaceScreen:
             self.drag_start_y = event.y
             return
 
-        # Find clicked artwork - use larger search area
-        items = self.canvas.find_overlapping(event.x - 2, event.y - 2, event.x + 2, event.y + 2)
-        artwork_items = [i for i in items if "artwork" in self.canvas.gettags(i)]
+        # Find clicked artwork, testing the topmost placements first
+        placed = self._hit_test(event.x, event.y)
 
-        # If not found with small area, try checking all artwork positions directly
-        if not artwork_items:
-            offset_x = self.pan_offset_x
-            offset_y = self.pan_offset_y
+        # Fall back to the drawn images, which also cover drop shadows
+        if not placed:
+            items = self.canvas.find_overlapping(event.x - 2, event.y - 2, event.x + 2, event.y + 2)
+            artwork_items = [i for i in items if i in self._id_to_placed]
+            if artwork_items:
+                placed = self._id_to_placed[artwork_items[-1]]
 
-            for placed in self.app.current_workspace.placed_artworks:
-                artwork = next((a for a in self.app.artworks if a.art_id == placed.artwork_id), None)
-                if not artwork:
-                    continue
+        if placed:
+            # Ctrl-click toggles multi-select, plain click selects just this piece
+            self._toggle_or_set_selection(placed, bool(event.state & 0x0004))
 
-                # Calculate artwork dimensions and position
-                if artwork.frame_config:
-                    width_cm, height_cm = FrameRenderer.calculate_total_dimensions(
-                        artwork.real_width_cm,
-                        artwork.real_height_cm,
-                        artwork.frame_config
-                    )
-                else:
-                    width_cm = artwork.real_width_cm
-                    height_cm = artwork.real_height_cm
-
-                x_px = offset_x + real_to_pixels(placed.x, self.scale)
-                y_px = offset_y + real_to_pixels(placed.y, self.scale)
-                w_px = real_to_pixels(width_cm, self.scale)
-                h_px = real_to_pixels(height_cm, self.scale)
-
-                # Check if click is within artwork bounds
-                if (x_px <= event.x <= x_px + w_px and y_px <= event.y <= y_px + h_px):
-                    # Check for Ctrl key (multi-select)
-                    if event.state & 0x0004:  # Ctrl is held
-                        if placed in self.selected_placed:
-                            self.selected_placed.remove(placed)
-                        else:
-                            self.selected_placed.append(placed)
-                    else:
-                        self.selected_placed = [placed]
-
-                    self.dragging_item = placed
-                    self.drag_start_x = event.x
-                    self.drag_start_y = event.y
-                    self._update_selection_info()
-                    self._render_workspace()
-                    return
-
-        elif artwork_items:
-            # Get the topmost artwork item
-            item = artwork_items[-1]
-
-            # Find which placed artwork this is
-            for placed in self.app.current_workspace.placed_artworks:
-                canvas_id, _ = self.canvas_items.get(id(placed), (None, None))
-                if canvas_id == item:
-                    # Check for Ctrl key (multi-select)
-                    if event.state & 0x0004:  # Ctrl is held
-                        if placed in self.selected_placed:
-                            self.selected_placed.remove(placed)
-                        else:
-                            self.selected_placed.append(placed)
-                    else:
-                        self.selected_placed = [placed]
-
-                    self.dragging_item = placed
-                    self.drag_start_x = event.x
-                    self.drag_start_y = event.y
-                    self._update_selection_info()
-                    self._render_workspace()
-                    return
+            self.dragging_item = placed
+            self.drag_start_x = event.x
+            self.drag_start_y = event.y
+            self._schedule_ui_refresh(selection=True)
+            self._render_workspace()
+            return
 
         # Clicked on empty space - deselect all
-        self.selected_placed = []
-        self._update_selection_info()
+        self._set_selection([])
+        self._schedule_ui_refresh(selection=True)
         self._render_workspace()
 
     def _on_canvas_drag(self, event):
@@ -873,9 +1055,10 @@ class ArrangementWorkspaceScreen:
                 new_pos_cm = max(0, min(new_pos_cm, self.app.current_wall.real_width_cm))
                 self.guidelines[self.dragging_guideline] = (orientation, new_pos_cm)
 
+            self._invalidate_guides()
             self.drag_start_x = event.x
             self.drag_start_y = event.y
-            self._render_workspace()
+            self._schedule_render()
             return
 
         if self.dragging_item:
@@ -887,23 +1070,40 @@ class ArrangementWorkspaceScreen:
             dx_cm = dx_px / self.scale if self.scale > 0 else 0
             dy_cm = dy_px / self.scale if self.scale > 0 else 0
 
-            # Move all selected items
-            for placed in self.selected_placed:
-                placed.x += dx_cm
-                placed.y += dy_cm
+            # Move all selected items, then snap and clamp them as one batch
+            selection = self._get_selection_cache()
+            xs, ys, widths, heights = self._pack_selection()
+            old_positions = [(real_to_pixels(x, self.scale), real_to_pixels(y, self.scale)) for x, y in zip(xs, ys)]
+
+            xs += dx_cm
+            ys += dy_cm
+            self._snap_and_clamp(xs, ys, widths, heights, snap=True)
+            self._unpack_selection(xs, ys)
 
-                # Apply snapping
-                self._apply_snapping(placed)
+            # Shift the existing canvas items by however far they ended up moving
+            needs_render = False
+            for (placed, _, _), (old_x_px, old_y_px) in zip(selection, old_positions):
+                canvas_id, _ = self.canvas_items.get(id(placed), (None, None))
+                if canvas_id is None:
+                    # Not drawn (e.g. culled offscreen), so it needs a full render
+                    needs_render = True
+                    continue
+                self.canvas.move(
+                    canvas_id,
+                    real_to_pixels(placed.x, self.scale) - old_x_px,
+                    real_to_pixels(placed.y, self.scale) - old_y_px
+                )
 
-                # Clamp to wall bounds
-                self._clamp_to_wall(placed)
+            # Measurements are stale while dragging; they are redrawn on release
+            self.canvas.delete("measurement")
+            self._hit_index_dirty = True
 
             # Update drag start position
             self.drag_start_x = event.x
             self.drag_start_y = event.y
 
-            # Re-render
-            self._render_workspace()
+            if needs_render:
+                self._schedule_render()
 
     def _on_canvas_release(self, event):
         """Handle mouse release"""
@@ -913,103 +1113,59 @@ class ArrangementWorkspaceScreen:
             # Create undo command for the move
             # This is simplified - a full implementation would store initial positions
             self.dragging_item = None
-        self.dragging_guideline = None
 
-    def _apply_snapping(self, placed: PlacedArtwork):
-        """Apply snapping to grid and guides"""
-        artwork = next((a for a in self.app.artworks if a.art_id == placed.artwork_id), None)
-        if not artwork:
-            return
+            # Items were moved in place during the drag; redraw overlays and bounds
+            self._render_workspace()
+        self.dragging_guideline = None
 
-        width_cm, height_cm = FrameRenderer.calculate_total_dimensions(
-            artwork.real_width_cm,
-            artwork.real_height_cm,
-            artwork.frame_config
+    def _snap_and_clamp(self, xs: np.ndarray, ys: np.ndarray, widths: np.ndarray, heights: np.ndarray,
+                        snap: bool):
+        """Snap to grid/guides (if enabled and snap is True) and clamp to the wall, in place"""
+        h_guides, v_guides = self._get_guide_arrays()
+        geometry.snap_clamp_batch(
+            xs, ys, widths, heights,
+            h_guides, v_guides,
+            self.app.current_wall.real_width_cm,
+            self.app.current_wall.real_height_cm,
+            config.DEFAULT_GRID_SPACING_CM,
+            self.snap_tolerance_cm,
+            snap and self.snap_grid_var.get(),
+            snap and self.snap_guides_var.get()
         )
 
-        # Snap to grid
-        if self.snap_grid_var.get():
-            grid_size = config.DEFAULT_GRID_SPACING_CM
-            placed.x = round(placed.x / grid_size) * grid_size
-            placed.y = round(placed.y / grid_size) * grid_size
-
-        # Snap to guidelines
-        if self.snap_guides_var.get():
-            tolerance = self.snap_tolerance_cm
-
-            for orientation, pos in self.guidelines:
-                if orientation == "horizontal":
-                    # Check top, middle, and bottom of artwork
-                    if abs(placed.y - pos) < tolerance:
-                        placed.y = pos
-                    elif abs(placed.y + height_cm/2 - pos) < tolerance:
-                        placed.y = pos - height_cm/2
-                    elif abs(placed.y + height_cm - pos) < tolerance:
-                        placed.y = pos - height_cm
-                else:  # vertical
-                    # Check left, center, and right of artwork
-                    if abs(placed.x - pos) < tolerance:
-                        placed.x = pos
-                    elif abs(placed.x + width_cm/2 - pos) < tolerance:
-                        placed.x = pos - width_cm/2
-                    elif abs(placed.x + width_cm - pos) < tolerance:
-                        placed.x = pos - width_cm
-
-    def _clamp_to_wall(self, placed: PlacedArtwork):
-        """Clamp artwork position to wall bounds"""
-        artwork = next((a for a in self.app.artworks if a.art_id == placed.artwork_id), None)
-        if not artwork:
-            return
-
-        # Calculate artwork total size
-        total_width, total_height = FrameRenderer.calculate_total_dimensions(
-            artwork.real_width_cm,
-            artwork.real_height_cm,
-            artwork.frame_config
-        )
+    def _get_guide_arrays(self):
+        """Get cached (horizontal, vertical) guideline positions as arrays"""
+        if self._guide_arrays is None:
+            h_guides = np.array([pos for o, pos in self.guidelines if o == "horizontal"], dtype=np.float64)
+            v_guides = np.array([pos for o, pos in self.guidelines if o == "vertical"], dtype=np.float64)
+            self._guide_arrays = (h_guides, v_guides)
+        return self._guide_arrays
 
-        # Clamp
-        placed.x = max(0, min(placed.x, self.app.current_wall.real_width_cm - total_width))
-        placed.y = max(0, min(placed.y, self.app.current_wall.real_height_cm - total_height))
+    def _invalidate_guides(self):
+        """Drop cached guideline arrays after guidelines change"""
+        self._guide_arrays = None
 
     def _align(self, direction: str):
         """Align selected artwork"""
         if len(self.selected_placed) < 2:
             return
 
-        # Calculate reference position
+        xs, ys, widths, heights = self._pack_selection()
+
         if direction == "left":
-            ref_x = min(p.x for p in self.selected_placed)
-            for placed in self.selected_placed:
-                placed.x = ref_x
+            self._unpack_selection(xs=geometry.align_positions(xs, widths, geometry.ALIGN_MIN))
         elif direction == "right":
             # Align right edges
-            max_right = max(
-                p.x + self._get_artwork_width(p)
-                for p in self.selected_placed
-            )
-            for placed in self.selected_placed:
-                placed.x = max_right - self._get_artwork_width(placed)
+            self._unpack_selection(xs=geometry.align_positions(xs, widths, geometry.ALIGN_MAX))
         elif direction == "center_h":
             # Align horizontal centers
-            avg_center = sum(p.x + self._get_artwork_width(p)/2 for p in self.selected_placed) / len(self.selected_placed)
-            for placed in self.selected_placed:
-                placed.x = avg_center - self._get_artwork_width(placed)/2
+            self._unpack_selection(xs=geometry.align_positions(xs, widths, geometry.ALIGN_CENTER))
         elif direction == "top":
-            ref_y = min(p.y for p in self.selected_placed)
-            for placed in self.selected_placed:
-                placed.y = ref_y
+            self._unpack_selection(ys=geometry.align_positions(ys, heights, geometry.ALIGN_MIN))
         elif direction == "bottom":
-            max_bottom = max(
-                p.y + self._get_artwork_height(p)
-                for p in self.selected_placed
-            )
-            for placed in self.selected_placed:
-                placed.y = max_bottom - self._get_artwork_height(placed)
+            self._unpack_selection(ys=geometry.align_positions(ys, heights, geometry.ALIGN_MAX))
         elif direction == "center_v":
-            avg_center = sum(p.y + self._get_artwork_height(p)/2 for p in self.selected_placed) / len(self.selected_placed)
-            for placed in self.selected_placed:
-                placed.y = avg_center - self._get_artwork_height(placed)/2
+            self._unpack_selection(ys=geometry.align_positions(ys, heights, geometry.ALIGN_CENTER))
 
         self._render_workspace()
 
@@ -1018,64 +1174,85 @@ class ArrangementWorkspaceScreen:
         if len(self.selected_placed) < 3:
             return
 
+        xs, ys, widths, heights = self._pack_selection()
+
         if direction == "horizontal":
-            # Sort by x position
-            sorted_placed = sorted(self.selected_placed, key=lambda p: p.x)
-
-            # Calculate total space and gaps
-            left_most = sorted_placed[0].x
-            right_most = sorted_placed[-1].x + self._get_artwork_width(sorted_placed[-1])
-            total_width = sum(self._get_artwork_width(p) for p in sorted_placed)
-            available_space = right_most - left_most - total_width
-            gap = available_space / (len(sorted_placed) - 1)
-
-            # Distribute
-            current_x = left_most
-            for placed in sorted_placed:
-                placed.x = current_x
-                current_x += self._get_artwork_width(placed) + gap
+            self._unpack_selection(xs=geometry.distribute_positions(xs, widths))
         else:  # vertical
-            # Sort by y position
-            sorted_placed = sorted(self.selected_placed, key=lambda p: p.y)
-
-            # Calculate total space and gaps
-            top_most = sorted_placed[0].y
-            bottom_most = sorted_placed[-1].y + self._get_artwork_height(sorted_placed[-1])
-            total_height = sum(self._get_artwork_height(p) for p in sorted_placed)
-            available_space = bottom_most - top_most - total_height
-            gap = available_space / (len(sorted_placed) - 1)
-
-            # Distribute
-            current_y = top_most
-            for placed in sorted_placed:
-                placed.y = current_y
-                current_y += self._get_artwork_height(placed) + gap
-
+            self._unpack_selection(ys=geometry.distribute_positions(ys, heights))
         self._render_workspace()
 
-    def _get_artwork_width(self, placed: PlacedArtwork) -> float:
-        """Get total width of placed artwork including frame"""
-        artwork = next((a for a in self.app.artworks if a.art_id == placed.artwork_id), None)
+    def _pack_selection(self):
+        """Pack selected artwork positions and sizes into arrays for the geometry kernels"""
+        selection = self._get_selection_cache()
+        count = len(selection)
+        xs = np.fromiter((placed.x for placed, _, _ in selection), dtype=np.float64, count=count)
+        ys = np.fromiter((placed.y for placed, _, _ in selection), dtype=np.float64, count=count)
+        widths, heights = self._selection_sizes
+        return xs, ys, widths, heights
+
+    def _unpack_selection(self, xs: np.ndarray = None, ys: np.ndarray = None):
+        """Write kernel results back to the selected artwork, only for the axes given"""
+        selection = self._get_selection_cache()
+        if xs is not None:
+            for (placed, _, _), x in zip(selection, xs):
+                placed.x = float(x)
+        if ys is not None:
+            for (placed, _, _), y in zip(selection, ys):
+                placed.y = float(y)
+
+    def _get_placed_dims(self, placed: PlacedArtwork):
+        """Get total (width_cm, height_cm) of placed artwork including frame"""
+        artwork = self._get_artwork(placed.artwork_id)
         if not artwork:
-            return 0
-        width, _ = FrameRenderer.calculate_total_dimensions(
-            artwork.real_width_cm,
-            artwork.real_height_cm,
-            artwork.frame_config
-        )
-        return width
-
-    def _get_artwork_height(self, placed: PlacedArtwork) -> float:
-        """Get total height of placed artwork including frame"""
-        artwork = next((a for a in self.app.artworks if a.art_id == placed.artwork_id), None)
-        if not artwork:
-            return 0
-        _, height = FrameRenderer.calculate_total_dimensions(
-            artwork.real_width_cm,
-            artwork.real_height_cm,
-            artwork.frame_config
-        )
-        return height
+            return 0, 0
+        return self._get_total_dims(artwork)
+
+    def _set_selection(self, placed_list):
+        """Replace the selection"""
+        self.selected_placed = list(placed_list)
+        self._selected_ids = {id(p) for p in self.selected_placed}
+        self._selected_frames = {key: value for key, value in self._selected_frames.items()
+                                 if key in self._selected_ids}
+        self._selection_version += 1
+
+    def _add_to_selection(self, placed: PlacedArtwork):
+        """Add an artwork to the selection"""
+        if id(placed) not in self._selected_ids:
+            self.selected_placed.append(placed)
+            self._selected_ids.add(id(placed))
+            self._selection_version += 1
+
+    def _remove_from_selection(self, placed: PlacedArtwork):
+        """Remove an artwork from the selection"""
+        if id(placed) in self._selected_ids:
+            self._selected_ids.discard(id(placed))
+            self._selected_frames.pop(id(placed), None)
+            self.selected_placed = [p for p in self.selected_placed if id(p) in self._selected_ids]
+            self._selection_version += 1
+
+    def _toggle_or_set_selection(self, placed: PlacedArtwork, ctrl: bool):
+        """Toggle an artwork in the selection when Ctrl is held, otherwise select only it"""
+        if not ctrl:
+            self._set_selection([placed])
+        elif id(placed) in self._selected_ids:
+            self._remove_from_selection(placed)
+        else:
+            self._add_to_selection(placed)
+
+    def _get_selection_cache(self):
+        """Get (placed, width_cm, height_cm) for each selected artwork, rebuilt when the selection changes"""
+        key = self._selection_version
+        if self._selection_cache_key != key:
+            self._selection_cache = [
+                (placed, *self._get_placed_dims(placed)) for placed in self.selected_placed
+            ]
+            self._selection_sizes = (
+                np.array([w for _, w, _ in self._selection_cache], dtype=np.float64),
+                np.array([h for _, _, h in self._selection_cache], dtype=np.float64)
+            )
+            self._selection_cache_key = key
+        return self._selection_cache
 
     def _add_guideline(self, orientation: str):
         """Add a new guideline"""
@@ -1087,11 +1264,13 @@ class ArrangementWorkspaceScreen:
             position = self.app.current_wall.real_width_cm / 2
 
         self.guidelines.append((orientation, position))
+        self._invalidate_guides()
         self._render_workspace()
 
     def _clear_guidelines(self):
         """Clear all guidelines"""
         self.guidelines.clear()
+        self._invalidate_guides()
         self._render_workspace()
 
     def _toggle_grid(self):
@@ -1130,14 +1309,14 @@ class ArrangementWorkspaceScreen:
             self.pan_start_x = event.x
             self.pan_start_y = event.y
 
-            self._render_workspace()
+            self._schedule_render()
 
     def _on_pan_end(self, event):
         """End panning"""
         self.panning = False
         self.canvas.configure(cursor="")
 
-    def _on_space_press(self, event):
+    def _on_space_press(self, event=None):
         """Handle space key press"""
         self.space_pressed = True
         self.canvas.configure(cursor="hand1")
@@ -1160,53 +1339,83 @@ class ArrangementWorkspaceScreen:
         """Handle right-click context menu"""
         # Find clicked item
         items = self.canvas.find_overlapping(event.x, event.y, event.x, event.y)
-        artwork_items = [i for i in items if "artwork" in self.canvas.gettags(i)]
+        artwork_items = [i for i in items if i in self._id_to_placed]
 
         if artwork_items:
-            # Find which placed artwork this is
-            for placed in self.app.current_workspace.placed_artworks:
-                canvas_id, _ = self.canvas_items.get(id(placed), (None, None))
-                if canvas_id == artwork_items[-1]:
-                    if placed not in self.selected_placed:
-                        self.selected_placed = [placed]
-                        self._update_selection_info()
-                        self._render_workspace()
-
-                    # Show context menu
-                    import tkinter as tk
-                    menu = tk.Menu(self.canvas, tearoff=0)
-                    menu.add_command(label="Delete", command=self._delete_selected)
-                    menu.add_separator()
-                    menu.add_command(label="Bring to Front", command=lambda: self._bring_to_front())
-                    menu.add_command(label="Send to Back", command=lambda: self._send_to_back())
-                    menu.post(event.x_root, event.y_root)
-                    break
+            placed = self._id_to_placed[artwork_items[-1]]
+            if id(placed) not in self._selected_ids:
+                self._set_selection([placed])
+                self._schedule_ui_refresh(selection=True)
+                self._render_workspace()
+
+            # Show context menu
+            import tkinter as tk
+            menu = tk.Menu(self.canvas, tearoff=0)
+            menu.add_command(label="Delete", command=self._delete_selected)
+            menu.add_separator()
+            menu.add_command(label="Bring to Front", command=lambda: self._bring_to_front())
+            menu.add_command(label="Send to Back", command=lambda: self._send_to_back())
+            menu.post(event.x_root, event.y_root)
 
     def _bring_to_front(self):
         """Bring selected artwork to front"""
         if not self.selected_placed:
             return
-        max_z = max(p.z_index for p in self.app.current_workspace.placed_artworks)
+        self._z_max += 1
         for placed in self.selected_placed:
-            placed.z_index = max_z + 1
+            placed.z_index = self._z_max
+        self._z_order_dirty = True
         self._render_workspace()
 
     def _send_to_back(self):
         """Send selected artwork to back"""
         if not self.selected_placed:
             return
-        min_z = min(p.z_index for p in self.app.current_workspace.placed_artworks)
+        self._z_min -= 1
         for placed in self.selected_placed:
-            placed.z_index = min_z - 1
+            placed.z_index = self._z_min
+        self._z_order_dirty = True
         self._render_workspace()
 
+    def _get_placed_by_z_desc(self):
+        """Get placed artwork sorted topmost first, re-sorted only after z changes"""
+        if self._z_order_dirty:
+            # Stable sort keeps later-added pieces above earlier ones at equal z
+            ascending = sorted(self.app.current_workspace.placed_artworks, key=lambda p: p.z_index)
+            self._placed_by_z_desc = ascending[::-1]
+            self._z_rank = {id(p): rank for rank, p in enumerate(self._placed_by_z_desc)}
+            self._z_order_dirty = False
+        return self._placed_by_z_desc
+
+    def _reset_z_range(self):
+        """Recompute the z_index range from the current workspace"""
+        placed_artworks = self.app.current_workspace.placed_artworks if self.app.current_workspace else []
+        self._z_max = max((p.z_index for p in placed_artworks), default=0)
+        self._z_min = min((p.z_index for p in placed_artworks), default=0)
+        self._z_order_dirty = True
+
+    def _track_z(self, placed: PlacedArtwork):
+        """Widen the z_index range to include a newly placed artwork"""
+        self._z_max = max(self._z_max, placed.z_index)
+        self._z_min = min(self._z_min, placed.z_index)
+        self._z_order_dirty = True
+
     def _delete_selected(self):
         """Delete selected artwork from workspace"""
         if not self.selected_placed:
             return
 
         # Create undo command
-        deleted_items = [(p.artwork_id, copy.deepcopy(p)) for p in self.selected_placed]
+        deleted_items = [
+            (p.artwork_id, PlacedArtwork(
+                artwork_id=p.artwork_id,
+                x=p.x,
+                y=p.y,
+                rotation=p.rotation,
+                z_index=p.z_index
+            ))
+            for p in self.selected_placed
+        ]
 
         def undo_delete(data):
             for art_id, placed_copy in data:
@@ -1219,11 +1428,13 @@ class ArrangementWorkspaceScreen:
                     z_index=placed_copy.z_index
                 )
                 self.app.current_workspace.placed_artworks.append(new_placed)
+                self._track_z(new_placed)
             self._render_workspace()
 
         def redo_delete(data):
             for art_id, _ in data:
                 self.app.current_workspace.remove_artwork(art_id)
+            self._z_order_dirty = True
             self._render_workspace()
 
         command = Command(
@@ -1235,14 +1446,13 @@ class ArrangementWorkspaceScreen:
         )
 
         self.undo_manager.execute(command)
-        self.selected_placed = []
-        self._update_selection_info()
-        self._update_undo_redo_buttons()
+        self._set_selection([])
+        self._schedule_ui_refresh(selection=True, undo=True)
 
     def _select_all(self):
         """Select all artwork"""
-        self.selected_placed = list(self.app.current_workspace.placed_artworks)
-        self._update_selection_info()
+        self._set_selection(self.app.current_workspace.placed_artworks)
+        self._schedule_ui_refresh(selection=True)
         self._render_workspace()
 
     def _nudge_selected(self, dx, dy):
@@ -1250,12 +1460,31 @@ class ArrangementWorkspaceScreen:
         if not self.selected_placed:
             return
 
-        for placed in self.selected_placed:
-            placed.x += dx
-            placed.y += dy
-            self._clamp_to_wall(placed)
+        xs, ys, widths, heights = self._pack_selection()
+        xs += dx
+        ys += dy
+        self._snap_and_clamp(xs, ys, widths, heights, snap=False)
+        self._unpack_selection(xs, ys)
 
         self._render_workspace()
+        self._schedule_ui_refresh(selection=True)
+
+    def _schedule_ui_refresh(self, selection: bool = False, undo: bool = False):
+        """Mark sidebar/toolbar state dirty and refresh it once on idle"""
+        pending = self._sel_info_dirty or self._undo_btn_dirty
+        self._sel_info_dirty = self._sel_info_dirty or selection
+        self._undo_btn_dirty = self._undo_btn_dirty or undo
+        if not pending:
+            self.canvas.after_idle(self._flush_ui_refresh)
+
+    def _flush_ui_refresh(self):
+        """Apply pending sidebar/toolbar refreshes"""
+        if self._sel_info_dirty:
+            self._sel_info_dirty = False
+            self._update_selection_info()
+        if self._undo_btn_dirty:
+            self._undo_btn_dirty = False
+            self._update_undo_redo_buttons()
 
     def _update_selection_info(self):
         """Update selection info in sidebar"""
@@ -1263,7 +1492,7 @@ class ArrangementWorkspaceScreen:
             self.info_label.configure(text="None", text_color="gray")
         elif len(self.selected_placed) == 1:
             placed = self.selected_placed[0]
-            artwork = next((a for a in self.app.artworks if a.art_id == placed.artwork_id), None)
+            artwork = self._get_artwork(placed.artwork_id)
             if artwork:
                 info_text = f"{artwork.name}\nPosition: ({placed.x:.1f}, {placed.y:.1f}) cm"
                 self.info_label.configure(text=info_text, text_color="white")
@@ -1271,24 +1500,28 @@ class ArrangementWorkspaceScreen:
             self.info_label.configure(text=f"{len(self.selected_placed)} items selected", text_color="white")
 
     def _zoom_in(self):
-        """Zoom in"""
-        old_zoom = self.zoom
-        self.zoom = min(self.zoom + config.ZOOM_STEP, config.MAX_ZOOM)
-
-        if old_zoom != self.zoom:
-            self.zoom_label.configure(text=f"{int(self.zoom * 100)}%")
-            self.rendered_frames.clear()
-            self._render_workspace()
+        """Zoom in to the next zoom level"""
+        new_zoom = next((z for z in config.ZOOM_LEVELS if z > self.zoom + 1e-6), self.zoom)
+        self._set_zoom(new_zoom)
 
     def _zoom_out(self):
-        """Zoom out"""
-        old_zoom = self.zoom
-        self.zoom = max(self.zoom - config.ZOOM_STEP, config.MIN_ZOOM)
+        """Zoom out to the previous zoom level"""
+        new_zoom = next((z for z in reversed(config.ZOOM_LEVELS) if z < self.zoom - 1e-6), self.zoom)
+        self._set_zoom(new_zoom)
 
-        if old_zoom != self.zoom:
-            self.zoom_label.configure(text=f"{int(self.zoom * 100)}%")
-            self.rendered_frames.clear()
-            self._render_workspace()
+    def _set_zoom(self, new_zoom: float):
+        """
+        Apply a zoom level and re-render
+
+        Zoom is kept on the fixed ladder in config.ZOOM_LEVELS, so rendered
+        frames cached for a level stay valid and are reused when returning to it.
+        """
+        if new_zoom == self.zoom:
+            return
+
+        self.zoom = new_zoom
+        self.zoom_label.configure(text=f"{int(round(self.zoom * 100))}%")
+        self._render_workspace()
 
     def _zoom_fit(self):
         """Fit wall to canvas"""
@@ -1296,18 +1529,17 @@ class ArrangementWorkspaceScreen:
         self.pan_offset_x = 20
         self.pan_offset_y = 20
         self.zoom_label.configure(text="100%")
-        self.rendered_frames.clear()
         self._render_workspace()
 
     def _undo(self):
         """Undo last action"""
         if self.undo_manager.undo():
-            self._update_undo_redo_buttons()
+            self._schedule_ui_refresh(undo=True)
 
     def _redo(self):
         """Redo last undone action"""
         if self.undo_manager.redo():
-            self._update_undo_redo_buttons()
+            self._schedule_ui_refresh(undo=True)
 
     def _update_undo_redo_buttons(self):
         """Update undo/redo button states"""
@@ -1324,37 +1556,40 @@ class ArrangementWorkspaceScreen:
     def _on_workspace_changed(self, workspace_name: str):
         """Handle workspace selection change"""
         # Find the workspace
-        for workspace in self.app.workspaces:
-            if workspace.name == workspace_name:
-                # Save current workspace state first
-                if self.app.current_workspace:
-                    self.app.current_workspace.grid_enabled = self.grid_var.get()
-                    self.app.current_workspace.grid_spacing_cm = config.DEFAULT_GRID_SPACING_CM
-                    self.app.current_workspace.guidelines = self.guidelines.copy()
-                    self.app.current_workspace.show_measurements = self.show_measurements
-                    self.app.current_workspace.zoom_level = self.zoom
-                    self.app.current_workspace.pan_offset_x = self.pan_offset_x
-                    self.app.current_workspace.pan_offset_y = self.pan_offset_y
-
-                # Switch to new workspace
-                self.app.switch_workspace(workspace)
-
-                # Restore workspace state
-                self.grid_var.set(workspace.grid_enabled)
-                self.guidelines = workspace.guidelines.copy() if workspace.guidelines else []
-                self.show_measurements = workspace.show_measurements
-                self.zoom = workspace.zoom_level
-                self.pan_offset_x = workspace.pan_offset_x
-                self.pan_offset_y = workspace.pan_offset_y
-
-                # Clear selection and undo history
-                self.selected_placed = []
-                self.undo_manager.clear()
-
-                # Re-render
-                self._render_workspace()
-                self._update_undo_redo_buttons()
-                break
+        workspace = self._workspace_by_name.get(workspace_name)
+        if not workspace:
+            return
+
+        # Save current workspace state first
+        if self.app.current_workspace:
+            self.app.current_workspace.grid_enabled = self.grid_var.get()
+            self.app.current_workspace.grid_spacing_cm = config.DEFAULT_GRID_SPACING_CM
+            self.app.current_workspace.guidelines = self.guidelines.copy()
+            self.app.current_workspace.show_measurements = self.show_measurements
+            self.app.current_workspace.zoom_level = self.zoom
+            self.app.current_workspace.pan_offset_x = self.pan_offset_x
+            self.app.current_workspace.pan_offset_y = self.pan_offset_y
+
+        # Switch to new workspace
+        self.app.switch_workspace(workspace)
+
+        # Restore workspace state
+        self.grid_var.set(workspace.grid_enabled)
+        self.guidelines = workspace.guidelines.copy() if workspace.guidelines else []
+        self._invalidate_guides()
+        self.show_measurements = workspace.show_measurements
+        self.zoom = workspace.zoom_level
+        self.pan_offset_x = workspace.pan_offset_x
+        self.pan_offset_y = workspace.pan_offset_y
+
+        # Clear selection and undo history
+        self._set_selection([])
+        self.undo_manager.clear()
+        self._reset_z_range()
+
+        # Re-render
+        self._render_workspace()
+        self._schedule_ui_refresh(undo=True)
 
     def _new_workspace(self):
         """Create a new workspace"""
@@ -1377,9 +1612,11 @@ class ArrangementWorkspaceScreen:
         self.workspace_var.set(new_workspace.name)
 
         # Clear and render
-        self.selected_placed = []
+        self._set_selection([])
         self.guidelines = []
+        self._invalidate_guides()
         self.undo_manager.clear()
+        self._reset_z_range()
         self._render_workspace()
         self._update_undo_redo_buttons()
 
@@ -1460,8 +1697,9 @@ class ArrangementWorkspaceScreen:
                 self.workspace_var.set(self.app.current_workspace.name)
 
             # Clear and render
-            self.selected_placed = []
+            self._set_selection([])
             self.undo_manager.clear()
+            self._reset_z_range()
             self._render_workspace()
             self._update_undo_redo_buttons()
 
@@ -1469,6 +1707,7 @@ class ArrangementWorkspaceScreen:
 
     def _refresh_workspace_list(self):
         """Refresh workspace dropdown list"""
+        self._workspace_by_name = {w.name: w for w in reversed(self.app.workspaces)}  # first match wins on duplicate names
         if hasattr(self, 'workspace_dropdown'):
             workspace_names = [w.name for w in self.app.workspaces] if self.app.workspaces else ["No workspaces"]
             self.workspace_dropdown.configure(values=workspace_names)
@@ -1554,10 +1793,16 @@ class ArrangementWorkspaceScreen:
 class ExportDialog:
     """Dialog for export options"""
 
+    _MB = 1.0 / (1024 * 1024)  # Bytes to megabytes
+
     def __init__(self, parent, wall):
         """Initialize export dialog"""
         self.result = None
         self.wall = wall
+        self._preview_after_id = None  # Pending debounced preview update
+        self._last_preview_text = None  # Skip label redraws when the text is unchanged
+        self._last_quality_text = None
+        self._preview_dirty = False  # Preview skipped while the dialog was hidden
 
         # Create dialog window
         self.dialog = ctk.CTkToplevel(parent)
@@ -1570,47 +1815,48 @@ class ExportDialog:
         self.dialog.grab_set()
 
         self._setup_ui()
+        self.dialog.bind("<Map>", self._on_dialog_map)
 
     def _setup_ui(self):
         """Setup the UI"""
+        # One grid container; rows carry the spacing the old nested frames did
         main_frame = ctk.CTkFrame(self.dialog)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        main_frame.grid_columnconfigure((1, 3), weight=1)
 
         # Title
         title = ctk.CTkLabel(main_frame, text="Export Settings", font=("Arial", 16, "bold"))
-        title.pack(pady=(0, 20))
+        title.grid(row=0, column=0, columnspan=5, pady=(0, 20))
 
         # Format selection
-        format_frame = ctk.CTkFrame(main_frame)
-        format_frame.pack(fill="x", pady=10)
-
-        ctk.CTkLabel(format_frame, text="Format:", font=("Arial", 12, "bold")).pack(anchor="w", padx=5, pady=5)
+        ctk.CTkLabel(main_frame, text="Format:", font=("Arial", 12, "bold")).grid(
+            row=1, column=0, columnspan=5, sticky="w", padx=5, pady=(10, 5))
 
         self.format_var = ctk.StringVar(value="PNG")
-        format_options = ctk.CTkFrame(format_frame)
-        format_options.pack(fill="x", padx=5)
 
         ctk.CTkRadioButton(
-            format_options,
+            main_frame,
             text="PNG (Lossless)",
             variable=self.format_var,
             value="PNG",
             command=self._on_format_changed
-        ).pack(side="left", padx=5)
+        ).grid(row=2, column=0, columnspan=2, sticky="w", padx=10)
 
         ctk.CTkRadioButton(
-            format_options,
+            main_frame,
             text="JPEG (Smaller file)",
             variable=self.format_var,
             value="JPEG",
             command=self._on_format_changed
-        ).pack(side="left", padx=5)
+        ).grid(row=2, column=2, columnspan=3, sticky="w", padx=5)
 
         # Quality slider (for JPEG)
-        self.quality_frame = ctk.CTkFrame(format_frame)
-        self.quality_frame.pack(fill="x", padx=5, pady=5)
+        self.quality_frame = ctk.CTkFrame(main_frame)
+        self.quality_frame.grid(row=3, column=0, columnspan=5, sticky="ew", padx=5, pady=5)
+        self.quality_frame.grid_columnconfigure(2, weight=1)
 
-        ctk.CTkLabel(self.quality_frame, text="JPEG Quality:", font=("Arial", 10)).pack(anchor="w", padx=5)
+        ctk.CTkLabel(self.quality_frame, text="JPEG Quality:", font=("Arial", 10)).grid(
+            row=0, column=0, columnspan=3, sticky="w", padx=5)
 
         self.quality_var = ctk.IntVar(value=95)
         self.quality_slider = ctk.CTkSlider(
@@ -1620,124 +1866,181 @@ class ExportDialog:
             variable=self.quality_var,
             number_of_steps=40
         )
-        self.quality_slider.pack(fill="x", padx=5)
+        self.quality_slider.grid(row=1, column=0, columnspan=3, sticky="ew", padx=5)
 
         self.quality_label = ctk.CTkLabel(self.quality_frame, text="95%", font=("Arial", 9))
-        self.quality_label.pack(anchor="e", padx=5)
+        self.quality_label.grid(row=2, column=0, columnspan=3, sticky="e", padx=5)
+
+        # Target size: solves for quality directly instead of sliding to it
+        ctk.CTkLabel(self.quality_frame, text="Target size (MB):", font=("Arial", 9)).grid(
+            row=3, column=0, sticky="w", padx=5, pady=(0, 5))
+        self.target_size_entry = ctk.CTkEntry(self.quality_frame, width=60)
+        self.target_size_entry.grid(row=3, column=1, padx=5, pady=(0, 5))
+        self.target_size_entry.bind("<Return>", lambda e: self._fit_quality_to_size())
+        ctk.CTkButton(
+            self.quality_frame,
+            text="Fit",
+            command=self._fit_quality_to_size,
+            width=40
+        ).grid(row=3, column=2, sticky="w", pady=(0, 5))
 
         self.quality_slider.configure(command=self._on_quality_changed)
-        self.quality_frame.pack_forget()  # Hide initially for PNG
+        self.quality_slider.bind("<ButtonRelease-1>", self._on_quality_release)
+        self.quality_frame.grid_remove()  # Hide initially for PNG
 
         # Resolution settings
-        size_frame = ctk.CTkFrame(main_frame)
-        size_frame.pack(fill="x", pady=10)
-
-        ctk.CTkLabel(size_frame, text="Resolution:", font=("Arial", 12, "bold")).pack(anchor="w", padx=5, pady=5)
+        ctk.CTkLabel(main_frame, text="Resolution:", font=("Arial", 12, "bold")).grid(
+            row=4, column=0, columnspan=5, sticky="w", padx=5, pady=(15, 5))
 
-        dim_inputs = ctk.CTkFrame(size_frame)
-        dim_inputs.pack(fill="x", padx=10, pady=5)
+        # Only digits can be typed, so reading the sizes never raises
+        vcmd = (self.dialog.register(lambda text: text == "" or (text.isascii() and text.isdigit())), "%P")
 
-        ctk.CTkLabel(dim_inputs, text="Width:", width=50).pack(side="left", padx=2)
-        self.width_var = ctk.IntVar(value=3840)
-        width_entry = ctk.CTkEntry(dim_inputs, textvariable=self.width_var, width=100)
-        width_entry.pack(side="left", padx=2)
-        width_entry.bind("<KeyRelease>", lambda e: self._update_preview())
+        ctk.CTkLabel(main_frame, text="Width:", width=50).grid(row=5, column=0, padx=(10, 2))
+        self.width_var = ctk.StringVar(value="3840")
+        width_entry = ctk.CTkEntry(main_frame, textvariable=self.width_var, width=100,
+                                   validate="key", validatecommand=vcmd)
+        width_entry.grid(row=5, column=1, sticky="w", padx=2)
+        self.width_var.trace_add("write", self._schedule_preview)
 
-        ctk.CTkLabel(dim_inputs, text="px    Height:", width=80).pack(side="left", padx=5)
-        self.height_var = ctk.IntVar(value=2160)
-        height_entry = ctk.CTkEntry(dim_inputs, textvariable=self.height_var, width=100)
-        height_entry.pack(side="left", padx=2)
-        height_entry.bind("<KeyRelease>", lambda e: self._update_preview())
+        ctk.CTkLabel(main_frame, text="px    Height:", width=80).grid(row=5, column=2, padx=5)
+        self.height_var = ctk.StringVar(value="2160")
+        height_entry = ctk.CTkEntry(main_frame, textvariable=self.height_var, width=100,
+                                    validate="key", validatecommand=vcmd)
+        height_entry.grid(row=5, column=3, sticky="w", padx=2)
+        self.height_var.trace_add("write", self._schedule_preview)
 
-        ctk.CTkLabel(dim_inputs, text="px").pack(side="left", padx=2)
+        ctk.CTkLabel(main_frame, text="px").grid(row=5, column=4, padx=(2, 10))
 
         # Preview info
-        preview_frame = ctk.CTkFrame(main_frame)
-        preview_frame.pack(fill="x", pady=15)
-
-        ctk.CTkLabel(preview_frame, text="Export Preview:", font=("Arial", 11, "bold")).pack(anchor="w", padx=5)
+        ctk.CTkLabel(main_frame, text="Export Preview:", font=("Arial", 11, "bold")).grid(
+            row=6, column=0, columnspan=5, sticky="w", padx=5, pady=(25, 0))
 
         self.preview_label = ctk.CTkLabel(
-            preview_frame,
+            main_frame,
             text="Resolution: 3840 x 2160\nEstimated size: ~8 MB",
             font=("Arial", 10),
             anchor="w",
             justify="left"
         )
-        self.preview_label.pack(anchor="w", padx=10, pady=5)
+        self.preview_label.grid(row=7, column=0, columnspan=5, sticky="w", padx=10, pady=5)
 
         self._update_preview()
 
         # Buttons
-        btn_frame = ctk.CTkFrame(main_frame)
-        btn_frame.pack(fill="x", pady=20)
-
         ctk.CTkButton(
-            btn_frame,
+            main_frame,
             text="Cancel",
             command=self._cancel,
             width=120
-        ).pack(side="left", padx=5)
+        ).grid(row=8, column=0, columnspan=2, sticky="w", padx=5, pady=20)
 
         ctk.CTkButton(
-            btn_frame,
+            main_frame,
             text="Export",
             command=self._export,
             width=120,
             fg_color="#4CAF50"
-        ).pack(side="right", padx=5)
+        ).grid(row=8, column=2, columnspan=3, sticky="e", padx=5, pady=20)
 
     def _on_format_changed(self):
         """Handle format change"""
         if self.format_var.get() == "JPEG":
-            self.quality_frame.pack(fill="x", padx=5, pady=5)
+            self.quality_frame.grid()
         else:
-            self.quality_frame.pack_forget()
+            self.quality_frame.grid_remove()
         self._update_preview()
 
     def _on_quality_changed(self, value):
-        """Handle quality slider change"""
-        self.quality_label.configure(text=f"{int(value)}%")
+        """Handle quality slider drag, only the percentage label updates immediately"""
+        quality_text = f"{int(value)}%"
+        if quality_text != self._last_quality_text:
+            self._last_quality_text = quality_text
+            self.quality_label.configure(text=quality_text)
+        self._schedule_preview(delay=200)
+
+    def _on_quality_release(self, event=None):
+        """Update the preview as soon as the quality slider is released"""
+        self._cancel_pending_preview()
         self._update_preview()
 
-    def _update_preview(self):
-        """Update preview information"""
-        # Get dimensions
-        try:
-            width = self.width_var.get()
-            height = self.height_var.get()
-        except:
-            width = 3840
-            height = 2160
+    def _schedule_preview(self, *_, delay: int = 150):
+        """Update the preview once input settles, restarting the delay on every change"""
+        if self._preview_after_id:
+            self.dialog.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.dialog.after(delay, self._update_preview)
+
+    def _cancel_pending_preview(self):
+        """Cancel a scheduled preview update"""
+        if self._preview_after_id:
+            self.dialog.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+
+    def _get_export_size(self):
+        """Get the entered export size, falling back to 4K for empty or zero input"""
+        width = int(self.width_var.get() or 0)
+        height = int(self.height_var.get() or 0)
 
         if width <= 0 or height <= 0:
             width = 3840
             height = 2160
 
-        # Estimate file size (rough approximation)
-        pixels = width * height
+        return width, height
+
+    def _fit_quality_to_size(self):
+        """Set JPEG quality to the value that best matches the target size"""
+        try:
+            target_mb = float(self.target_size_entry.get())
+        except ValueError:
+            return
+        if not math.isfinite(target_mb):
+            return
+
+        width, height = self._get_export_size()
+        quality = jpeg_size.quality_for_size(width, height, target_mb / self._MB,
+                                             min_quality=60, max_quality=100)
+        self.quality_var.set(quality)
+        self._on_quality_changed(quality)
+        self._on_quality_release()
+
+    def _on_dialog_map(self, event):
+        """Catch up on a preview update skipped while the dialog was hidden"""
+        if event.widget is self.dialog and self._preview_dirty:
+            self._update_preview()
+
+    def _update_preview(self):
+        """Update preview information"""
+        self._preview_after_id = None
+
+        if not self.dialog.winfo_viewable():
+            self._preview_dirty = True
+            return
+        self._preview_dirty = False
+
+        width, height = self._get_export_size()
+
+        # Estimate file size (~3 bytes per pixel for PNG)
         if self.format_var.get() == "PNG":
-            estimated_mb = pixels * 3 / (1024 * 1024)  # ~3 bytes per pixel for PNG
+            estimated_mb = width * height * 3.0 * self._MB
         else:
-            quality_factor = self.quality_var.get() / 100.0
-            estimated_mb = pixels * 0.5 * quality_factor / (1024 * 1024)  # JPEG compression
+            estimated_mb = jpeg_size.predict_bytes(width, height, self.quality_var.get()) * self._MB
 
-        self.preview_label.configure(
-            text=f"Resolution: {width} x {height} px\n"
-                 f"Aspect ratio: {width/height:.2f}\n"
-                 f"Estimated size: ~{estimated_mb:.1f} MB"
-        )
+        new_text = (f"Resolution: {width} x {height} px\n"
+                    f"Aspect ratio: {width/height:.2f}\n"
+                    f"Estimated size: ~{estimated_mb:.1f} MB")
+        if new_text != self._last_preview_text:
+            self._last_preview_text = new_text
+            self.preview_label.configure(text=new_text)
 
     def _cancel(self):
         """Cancel export"""
         self.result = None
+        self._cancel_pending_preview()
         self.dialog.destroy()
 
     def _export(self):
         """Confirm export"""
         # Get final dimensions
-        width = self.width_var.get()
-        height = self.height_var.get()
+        width, height = self._get_export_size()
 
         self.result = {
             "format": self.format_var.get(),
@@ -1745,5 +2048,6 @@ class ExportDialog:
             "width": width,
             "height": height
         }
+        self._cancel_pending_preview()
         self.dialog.destroy()
 
@@ -3,20 +3,43 @@ Art Editor Screen - Enhanced with Advanced Editing Tools
 """
 import customtkinter as ctk
 from tkinter import filedialog, Canvas
-from PIL import Image, ImageTk, ImageEnhance, ImageFilter
+from PIL import Image, ImageTk
 import os
+import math
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import numpy as np
 from models.artwork import Artwork
 from processors.image_processor import ImageProcessor
 from utils.file_manager import FileManager
-from utils.perspective import apply_perspective_correction
+from utils.perspective import apply_perspective_correction, perspective_maps
+from utils import color_kernels
 import config
 
 
+# art_id -> PIL thumbnail, shared by every editor screen in this session
+_THUMB_CACHE = {}
+
+# art_id -> number of the latest save; older renders that finish late are dropped
+_SAVE_GENERATIONS = {}
+
+
 class ArtEditorScreen:
     """Screen for importing and editing artwork"""
 
+    # Rows of B, G, R weights that give every channel its pixel's grey value
+    _GREY_WEIGHTS = np.tile([0.114, 0.587, 0.299], (3, 1))
+
+    # Import dialog file filters
+    _FILETYPES = (
+        ("Image Files", "*.jpg *.jpeg *.png *.bmp *.tiff"),
+        ("JPEG Images", "*.jpg *.jpeg"),
+        ("PNG Images", "*.png"),
+        ("All Files", "*.*")
+    )
+
     def __init__(self, app, parent):
         """
         Initialize art editor screen
@@ -32,11 +55,33 @@ class ArtEditorScreen:
         self.selected_artwork = None
         self.thumbnail_images = {}  # art_id -> PhotoImage for thumbnails
         self.preview_image = None  # Current preview PhotoImage
+        self._row_widgets = []  # (frame, thumb, name, dims, edit button, art_id) per list row
+        self._empty_list_label = None  # Shown when no artwork is imported
+        self._batch_depth = {}  # container -> nesting depth of _batch_ui
+        self._io_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)  # Decodes imported images
+        self._prefetched = {}  # art_id -> (source image, future of (preview source, scale))
+        self._preview_key = None  # What the preview PhotoImage currently shows
+        self._preview_item = None  # Canvas item displaying the preview PhotoImage
+        self._wb_lut_cache = {}  # white balance settings -> lookup tables
+        self._resize_buf = None  # Resize buffer for the preview size
+        self._warp_maps = None  # (corner key, map1, map2) remap tables for the preview warp
+        self._warped_preview = None  # (source, corner key, warped preview) last perspective result
+        self._warp_buf = None  # Destination buffer for the preview warp
+        self._adjust_fit = None  # (source, geometry key, canvas-fitted edited image, scale) for adjust mode
+        self._crop_overlay_mask = None  # Dimmed RGBA mask the size of the preview
+        self._crop_overlay_hole = None  # Box currently cleared in the mask
+        self._crop_overlay_photo = None  # PhotoImage the crop mask is pasted into
+        self._crop_overlay_item = None  # Canvas item displaying the crop mask
+        self._canvas_corners = []  # Canvas positions of the drawn perspective corners
+        self._canvas_w = 600  # Edit canvas size, updated from <Configure>
+        self._canvas_h = 400
+        self._resize_job = None  # Pending preview refit after a canvas resize
+        self._preview_after_id = None  # Pending throttled preview rebuild
+        self._drag_redraw_pending = False  # A marker move is queued for idle time
+        self._drag_moved_point = None  # Corner index the queued marker move applies to
 
         # Editing state
         self.original_photo = None  # Current artwork being edited (numpy array)
-        self.edited_photo = None  # With perspective/crop applied
-        self.uncropped_photo = None  # Perspective-corrected but not cropped (for expanding crop box)
         self.corner_points = None  # For perspective correction
         self.crop_box = None  # (x1, y1, x2, y2) for crop
         self.dragging_point = None
@@ -57,6 +102,9 @@ class ArtEditorScreen:
         # Edit mode
         self.edit_mode = "perspective"  # 'perspective', 'crop', 'adjust'
 
+        # Compile the white balance kernel in the background before the first edit
+        self._io_pool.submit(color_kernels.warm_up)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -65,14 +113,18 @@ class ArtEditorScreen:
         main_frame = ctk.CTkFrame(self.parent)
         main_frame.pack(fill="both", expand=True)
 
+        # Fixed-width sidebar column, editing area takes the rest
+        main_frame.grid_columnconfigure(0, minsize=300)
+        main_frame.grid_columnconfigure(1, weight=1)
+        main_frame.grid_rowconfigure(0, weight=1)
+
         # Left sidebar (artwork list)
         left_panel = ctk.CTkFrame(main_frame, width=280)
-        left_panel.pack(side="left", fill="y", padx=10, pady=10)
-        left_panel.pack_propagate(False)
+        left_panel.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
 
         # Center/right (editing area)
         right_panel = ctk.CTkFrame(main_frame)
-        right_panel.pack(side="right", fill="both", expand=True, padx=10, pady=10)
+        right_panel.grid(row=0, column=1, sticky="nsew", padx=10, pady=10)
 
         self._setup_artwork_list(left_panel)
         self._setup_info_panel(right_panel)
@@ -116,51 +168,105 @@ class ArtEditorScreen:
     def _setup_info_panel(self, parent):
         """Set up info/editing panel"""
         self.info_panel = parent
+        self.editor_container = None  # Built on first edit, then reused
 
         # Welcome message
-        welcome = ctk.CTkLabel(
+        self.welcome_label = ctk.CTkLabel(
             parent,
             text="Import artwork to get started\n\nClick 'Import Artwork' to add images",
             font=("Arial", 14),
             text_color="gray"
         )
-        welcome.pack(expand=True)
+        self.welcome_label.pack(expand=True)
 
     def _import_artwork(self):
         """Import artwork files"""
         file_paths = filedialog.askopenfilenames(
             title="Select Artwork Images",
-            filetypes=[
-                ("Image Files", "*.jpg *.jpeg *.png *.bmp *.tiff"),
-                ("JPEG Images", "*.jpg *.jpeg"),
-                ("PNG Images", "*.png"),
-                ("All Files", "*.*")
-            ]
+            filetypes=self._FILETYPES
         )
 
         if file_paths:
-            imported_count = 0
-            for file_path in file_paths:
-                if self._add_artwork(file_path):
-                    imported_count += 1
+            # Decode in the background; Tk state is only touched from _poll_imports
+            futures = deque((file_path, self._io_pool.submit(self._decode_import, file_path))
+                            for file_path in file_paths)
+            self._poll_imports(futures)
 
-            self._refresh_artwork_list()
+    def _poll_imports(self, futures: deque, imported_count: int = 0):
+        """
+        Add imported artwork in selection order as the images finish decoding
 
-            if imported_count > 0:
-                self.app._show_info(f"Successfully imported {imported_count} artwork(s)!")
+        Args:
+            futures: Remaining (file path, future) pairs, in selection order
+            imported_count: Number of artworks added so far
+        """
+        # Add every leading file that is ready, then lay out the list once
+        if futures and futures[0][1].done():
+            # Keep importing into the project after the user leaves the editor, without the list
+            if self.artwork_list_frame.winfo_exists():
+                with self._batch_ui(self.artwork_list_frame):
+                    imported_count += self._add_ready_imports(futures)
+                    self._refresh_artwork_list()
             else:
-                self.app._show_error("Failed to import any images. Please check the file formats.")
+                imported_count += self._add_ready_imports(futures)
+
+        if futures:
+            self.parent.after(30, self._poll_imports, futures, imported_count)
+            return
+
+        if imported_count > 0:
+            self.app._show_info(f"Successfully imported {imported_count} artwork(s)!")
+        else:
+            self.app._show_error("Failed to import any images. Please check the file formats.")
 
-    def _add_artwork(self, file_path: str) -> bool:
+    def _add_ready_imports(self, futures: deque) -> int:
+        """
+        Add the leading imports whose images have finished decoding
+
+        Args:
+            futures: Remaining (file path, future) pairs, in selection order
+
+        Returns:
+            Number of artworks added
+        """
+        added = 0
+        while futures and futures[0][1].done():
+            file_path, future = futures.popleft()
+            try:
+                image, thumbnail = future.result()
+            except Exception as e:
+                # One bad file must not stop the rest of the batch
+                print(f"Error decoding {file_path}: {e}")
+                continue
+
+            if self._add_artwork(file_path, image, thumbnail):
+                added += 1
+        return added
+
+    @staticmethod
+    def _decode_import(file_path: str, thumb_size: int = 60):
+        """Load an image and its list thumbnail (runs on a worker thread)"""
+        image = ImageProcessor.load_image(file_path)
+        if image is None:
+            return None, None
+        return image, ImageProcessor.make_thumbnail(image, thumb_size)
+
+    def _add_artwork(self, file_path: str, image: np.ndarray = None, thumbnail=None) -> bool:
         """
         Add artwork to collection
 
+        Args:
+            file_path: Path to the image file
+            image: Already decoded image, loaded from file_path if None
+            thumbnail: Prepared PIL thumbnail, created from image if None
+
         Returns:
             True if successful, False otherwise
         """
         try:
             # Load image
-            image = ImageProcessor.load_image(file_path)
+            if image is None:
+                image = ImageProcessor.load_image(file_path)
             if image is None:
                 print(f"Failed to load image: {file_path}")
                 return False
@@ -183,15 +289,16 @@ class ArtEditorScreen:
                 original_image_path=file_path,
                 real_width_cm=default_width_cm,
                 real_height_cm=default_height_cm,
-                real_width_inches=default_width_cm / 2.54,
-                real_height_inches=default_height_cm / 2.54
+                real_width_inches=default_width_cm * config.CM_TO_INCH,
+                real_height_inches=default_height_cm * config.CM_TO_INCH
             )
 
             self.app.artworks.append(artwork)
+            self.app.artworks_by_id[art_id] = artwork
             self.app.artwork_images[art_id] = image
 
             # Create thumbnail
-            self._create_thumbnail(art_id, image)
+            self._create_thumbnail(art_id, image, thumbnail=thumbnail)
 
             return True
 
@@ -199,117 +306,179 @@ class ArtEditorScreen:
             print(f"Error adding artwork: {e}")
             return False
 
-    def _create_thumbnail(self, art_id: str, image: np.ndarray, size: int = 60):
-        """Create thumbnail for artwork"""
+    def _create_thumbnail(self, art_id: str, image: np.ndarray, size: int = 60, thumbnail=None):
+        """Create thumbnail for artwork and store it in the session and disk caches"""
         try:
-            # Convert to PIL
-            img_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            pil_img = Image.fromarray(img_rgb)
-
-            # Create thumbnail maintaining aspect ratio
-            pil_img.thumbnail((size, size), Image.Resampling.LANCZOS)
+            # Shrink before converting so only the thumbnail is copied to PIL
+            pil_img = thumbnail if thumbnail is not None else ImageProcessor.make_thumbnail(image, size)
+            _THUMB_CACHE[art_id] = pil_img
 
             # Convert to PhotoImage
             photo = ImageTk.PhotoImage(pil_img)
             self.thumbnail_images[art_id] = photo
 
+            cache_path = self._thumbnail_cache_path(art_id)
+            if cache_path:
+                self._io_pool.submit(pil_img.save, cache_path, optimize=True)
+
         except Exception as e:
             print(f"Error creating thumbnail: {e}")
 
-    def _refresh_artwork_list(self):
-        """Refresh the artwork list display"""
-        # Clear existing items
-        for widget in self.artwork_list_frame.winfo_children():
-            widget.destroy()
+    def _thumbnail_cache_path(self, art_id: str) -> str:
+        """Get the on-disk thumbnail path, or an empty string when the project is unsaved"""
+        if not self.app.file_manager:
+            return ""
+        return self.app.file_manager.get_artwork_image_path(art_id, "thumbnail")
 
-        if len(self.app.artworks) == 0:
-            info = ctk.CTkLabel(
-                self.artwork_list_frame,
-                text="No artwork imported yet",
-                text_color="gray",
-                font=("Arial", 10)
-            )
-            info.pack(pady=20)
-            return
+    def _get_thumbnail(self, artwork: Artwork):
+        """
+        Get the list thumbnail for an artwork
 
-        # Add artwork items with thumbnails
-        for artwork in self.app.artworks:
-            item_frame = ctk.CTkFrame(self.artwork_list_frame, fg_color="#2B2B2B", height=70)
-            item_frame.pack(fill="x", pady=3, padx=2)
-            item_frame.pack_propagate(False)
+        Looks in this screen's PhotoImages, then the session cache, then the
+        disk cache (when newer than the source image), and finally builds one
+        from the loaded image.
 
-            # Thumbnail
-            if artwork.art_id in self.thumbnail_images:
-                thumb_label = ctk.CTkLabel(
-                    item_frame,
-                    image=self.thumbnail_images[artwork.art_id],
-                    text=""
+        Returns:
+            PhotoImage, or None if no thumbnail is available
+        """
+        art_id = artwork.art_id
+        photo = self.thumbnail_images.get(art_id)
+        if photo is not None:
+            return photo
+
+        pil_img = _THUMB_CACHE.get(art_id)
+        if pil_img is None:
+            cache_path = self._thumbnail_cache_path(art_id)
+            try:
+                if (cache_path and os.path.exists(cache_path) and
+                        (not os.path.exists(artwork.original_image_path) or
+                         os.path.getmtime(cache_path) >= os.path.getmtime(artwork.original_image_path))):
+                    with Image.open(cache_path) as cached:
+                        pil_img = cached.convert("RGB")
+                    _THUMB_CACHE[art_id] = pil_img
+            except Exception as e:
+                print(f"Error loading cached thumbnail: {e}")
+
+        if pil_img is not None:
+            photo = ImageTk.PhotoImage(pil_img)
+            self.thumbnail_images[art_id] = photo
+            return photo
+
+        image = self.app.artwork_images.get(art_id)
+        if image is not None:
+            self._create_thumbnail(art_id, image)
+        return self.thumbnail_images.get(art_id)
+
+    def _refresh_artwork_list(self):
+        """Refresh the artwork list display, reusing existing rows"""
+        artworks = self.app.artworks
+
+        if len(artworks) == 0:
+            if self._empty_list_label is None:
+                self._empty_list_label = ctk.CTkLabel(
+                    self.artwork_list_frame,
+                    text="No artwork imported yet",
+                    text_color="gray",
+                    font=("Arial", 10)
                 )
-                thumb_label.pack(side="left", padx=5, pady=5)
+                self._empty_list_label.pack(pady=20)
+        elif self._empty_list_label is not None:
+            self._empty_list_label.destroy()
+            self._empty_list_label = None
+
+        # Update rows that already exist, create any that are missing
+        for i, artwork in enumerate(artworks):
+            if i < len(self._row_widgets):
+                self._update_artwork_row(i, artwork)
+            else:
+                self._row_widgets.append(self._create_artwork_row(artwork))
 
-            # Info container
-            info_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
-            info_frame.pack(side="left", fill="both", expand=True, padx=5)
+        # Drop rows for artwork that has been removed
+        while len(self._row_widgets) > len(artworks):
+            self._row_widgets.pop()[0].destroy()
 
-            name_label = ctk.CTkLabel(
-                info_frame,
-                text=artwork.name,
-                anchor="w",
-                font=("Arial", 10, "bold")
-            )
-            name_label.pack(anchor="w", pady=(5, 2))
+        self.artwork_list_frame.update_idletasks()
 
-            dim_label = ctk.CTkLabel(
-                info_frame,
-                text=f"{artwork.real_width_cm:.1f} x {artwork.real_height_cm:.1f} cm",
-                anchor="w",
-                font=("Arial", 8),
-                text_color="gray"
-            )
-            dim_label.pack(anchor="w")
-
-            # Edit button
-            edit_btn = ctk.CTkButton(
-                item_frame,
-                text="✏️ Edit",
-                width=70,
-                height=30,
-                command=lambda a=artwork: self._edit_artwork(a),
-                fg_color="#1F6AA5"
-            )
-            edit_btn.pack(side="right", padx=5, pady=5)
+    def _create_artwork_row(self, artwork: Artwork) -> tuple:
+        """Create a list row for an artwork"""
+        item_frame = ctk.CTkFrame(self.artwork_list_frame, fg_color="#2B2B2B", height=70)
+        item_frame.pack(fill="x", pady=3, padx=2)
+        item_frame.pack_propagate(False)
+        item_frame.bind("<Enter>", lambda e, i=len(self._row_widgets): self._on_row_enter(i))
+
+        # Thumbnail (only packed when the artwork has one)
+        thumb_label = ctk.CTkLabel(item_frame, text="")
+
+        # Info container
+        info_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
+        info_frame.pack(side="left", fill="both", expand=True, padx=5)
+
+        name_label = ctk.CTkLabel(
+            info_frame,
+            text=artwork.name,
+            anchor="w",
+            font=("Arial", 10, "bold")
+        )
+        name_label.pack(anchor="w", pady=(5, 2))
+
+        dim_label = ctk.CTkLabel(
+            info_frame,
+            anchor="w",
+            font=("Arial", 8),
+            text_color="gray"
+        )
+        dim_label.pack(anchor="w")
+
+        # Edit button, dispatched by row position so refreshes never rebind it
+        edit_btn = ctk.CTkButton(
+            item_frame,
+            text="✏️ Edit",
+            width=70,
+            height=30,
+            command=lambda i=len(self._row_widgets): self._on_edit_click(i),
+            fg_color="#1F6AA5"
+        )
+        edit_btn.pack(side="right", padx=5, pady=5)
+
+        row = (item_frame, thumb_label, name_label, dim_label, edit_btn, None)
+        self._fill_artwork_row(row, artwork, info_frame)
+        return row[:5] + (artwork.art_id,)
+
+    def _update_artwork_row(self, index: int, artwork: Artwork):
+        """Update an existing list row in place to show an artwork"""
+        row = self._row_widgets[index]
+        info_frame = row[2].master
+        self._fill_artwork_row(row, artwork, info_frame)
+        self._row_widgets[index] = row[:5] + (artwork.art_id,)
+
+    def _fill_artwork_row(self, row: tuple, artwork: Artwork, info_frame):
+        """Set the thumbnail and labels of a list row"""
+        _, thumb_label, name_label, dim_label, _, _ = row
+
+        thumbnail = self._get_thumbnail(artwork)
+        if thumbnail is not None:
+            thumb_label.configure(image=thumbnail)
+            thumb_label.pack(side="left", padx=5, pady=5, before=info_frame)
+        else:
+            thumb_label.pack_forget()
+
+        name_label.configure(text=artwork.name)
+        dim_label.configure(text=f"{artwork.real_width_cm:.1f} x {artwork.real_height_cm:.1f} cm")
 
     def _edit_artwork(self, artwork: Artwork):
         """Edit artwork with full editing tools"""
         self.selected_artwork = artwork
+        self._preview_key = None
 
         # Load original image
         if artwork.art_id in self.app.artwork_images:
-            self.original_photo = self.app.artwork_images[artwork.art_id].copy()
+            self.original_photo = self.app.artwork_images[artwork.art_id]
         else:
             self.app._show_error("Image not found for this artwork")
             return
 
-        # Initialize editing state
-        height, width = self.original_photo.shape[:2]
-
         # Load saved editing state or initialize defaults
-        if artwork.corner_points and len(artwork.corner_points) == 4:
-            self.corner_points = artwork.corner_points.copy()
-        else:
-            # Default corners (full image)
-            margin = 20
-            self.corner_points = [
-                (margin, margin),  # Top-left
-                (width - margin, margin),  # Top-right
-                (width - margin, height - margin),  # Bottom-right
-                (margin, height - margin)  # Bottom-left
-            ]
-
-        if artwork.crop_box:
-            self.crop_box = artwork.crop_box
-        else:
-            self.crop_box = (0, 0, width, height)
+        self.corner_points, self.crop_box = self._initial_edit_state(artwork, self.original_photo)
 
         # Load white balance settings
         if artwork.white_balance_adjustments:
@@ -325,64 +494,258 @@ class ArtEditorScreen:
             self.wb_contrast = 0.0
             self.wb_saturation = 0.0
 
-        # Apply current edits
-        self._apply_current_edits()
+        # Live previews run on a downscaled copy, reusing one prefetched while hovering the row
+        # A prefetch only counts if it was made from the image being edited, not one since replaced
+        source, future = self._prefetched.pop(artwork.art_id, (None, None))
+        prefetched = None
+        if future is not None and source is self.original_photo:
+            try:
+                prefetched = future.result()
+            except Exception as e:
+                print(f"Error prefetching preview: {e}")
+
+        if prefetched is None:
+            prefetched = self._make_preview_source(self.original_photo)
+        self._preview_src, self._preview_scale = prefetched
+
+        # Swap the welcome message for the editor and fill it in
+        with self._batch_ui(self.info_panel):
+            self.welcome_label.pack_forget()
+            self._ensure_editor_ui()
+            self._populate_editor_ui()
+
+    @contextmanager
+    def _batch_ui(self, container):
+        """
+        Batch widget changes in a container into a single relayout
 
-        # Clear info panel and show editor
-        for widget in self.info_panel.winfo_children():
-            widget.destroy()
+        Geometry propagation is suspended while the block runs and pending
+        layout is flushed once on exit. Nested uses on the same container
+        only flush when the outermost block exits.
 
-        self._setup_editor_ui()
+        Args:
+            container: Widget whose children are being rebuilt
+        """
+        depth = self._batch_depth.get(container, 0)
+        self._batch_depth[container] = depth + 1
+        propagate = container.pack_propagate() if depth == 0 else None
+        if depth == 0:
+            container.pack_propagate(False)
+        try:
+            yield container
+        finally:
+            if depth == 0:
+                del self._batch_depth[container]
+                container.pack_propagate(propagate)
+                container.update_idletasks()
+            else:
+                self._batch_depth[container] = depth
 
-    def _apply_current_edits(self):
-        """Apply perspective correction and crop to get edited image"""
-        # Start with original
-        result = self.original_photo.copy()
+    @staticmethod
+    def _initial_edit_state(artwork: Artwork, image: np.ndarray):
+        """Get the saved corner points and crop box of an artwork, or full-image defaults"""
+        height, width = image.shape[:2]
+
+        if artwork.corner_points and len(artwork.corner_points) == 4:
+            corner_points = artwork.corner_points.copy()
+        else:
+            # Default corners (full image)
+            margin = 20
+            corner_points = [
+                (margin, margin),  # Top-left
+                (width - margin, margin),  # Top-right
+                (width - margin, height - margin),  # Bottom-right
+                (margin, height - margin)  # Bottom-left
+            ]
+
+        if artwork.crop_box:
+            crop_box = artwork.crop_box
+        else:
+            crop_box = (0, 0, width, height)
+
+        return corner_points, crop_box
+
+    @staticmethod
+    def _make_preview_source(image: np.ndarray):
+        """
+        Downscale an image to the working size used for live previews
+
+        Args:
+            image: Full-resolution image
+
+        Returns:
+            Tuple of (preview image, scale from full-resolution to preview pixels)
+        """
+        height, width = image.shape[:2]
+        scale = min(1.0, config.EDIT_PREVIEW_MAX_SIZE / max(height, width))
+        if scale >= 1.0:
+            return image, 1.0
+        preview = cv2.resize(image, (max(1, round(width * scale)), max(1, round(height * scale))),
+                             interpolation=cv2.INTER_AREA)
+        return preview, scale
+
+    def _prefetch_edits(self, artwork: Artwork):
+        """Start downscaling an artwork's preview source before it is opened"""
+        image = self.app.artwork_images.get(artwork.art_id)
+        if image is None:
+            return
+
+        pending = self._prefetched.get(artwork.art_id)
+        if pending is not None:
+            if pending[0] is image:
+                return
+            # The artwork's image was replaced since this prefetch started
+            del self._prefetched[artwork.art_id]
+            pending[1].cancel()
+
+        # Keep only the most recent few hovers
+        while len(self._prefetched) >= 4:
+            self._prefetched.pop(next(iter(self._prefetched)))[1].cancel()
+
+        self._prefetched[artwork.art_id] = (image, self._io_pool.submit(self._make_preview_source, image))
+
+    def _on_edit_click(self, index: int):
+        """Edit the artwork shown in a list row"""
+        if index < len(self.app.artworks):
+            self._edit_artwork(self.app.artworks[index])
+
+    def _on_row_enter(self, index: int):
+        """Prefetch the preview source for the artwork in a hovered list row"""
+        if index < len(self.app.artworks) and self.app.artworks[index] is not self.selected_artwork:
+            self._prefetch_edits(self.app.artworks[index])
+
+    def _compute_preview_edits(self):
+        """Apply perspective correction and crop to the downscaled preview source"""
+        scale = self._preview_scale
+        corner_points = [(x * scale, y * scale) for x, y in self.corner_points]
+        crop_box = tuple(v * scale for v in self.crop_box) if self.crop_box else None
+
+        result = self._preview_src
+        if corner_points and len(corner_points) == 4:
+            # Only re-warp when the corners or source changed; a crop change is just a new view
+            # Collapsed corners give a zero side, which cv2 cannot build remap tables for
+            size = tuple(max(1, side) for side in self._corrected_size(corner_points, result.shape))
+            key = (tuple(corner_points), size)
+            cached = self._warped_preview
+            if cached is None or cached[0] is not result or cached[1] != key:
+                # Remap tables are rebuilt only when the corners move
+                if self._warp_maps is None or self._warp_maps[0] != key:
+                    self._warp_maps = (key, *perspective_maps(corner_points, *size))
+                # Warp into a buffer kept across corner changes, reallocated only when the size changes
+                width_out, height_out = size
+                if self._warp_buf is None or self._warp_buf.shape[:2] != (height_out, width_out):
+                    self._warp_buf = np.empty((height_out, width_out, 3), np.uint8)
+                warped = cv2.remap(result, self._warp_maps[1], self._warp_maps[2], cv2.INTER_LINEAR,
+                                   dst=self._warp_buf)
+                self._warped_preview = (result, key, warped)
+            result = self._warped_preview[2]
+
+        return result, self._crop_image(result, crop_box)
+
+    @staticmethod
+    def _corrected_size(corner_points, image_shape) -> tuple:
+        """Get the (width, height) of the perspective-corrected image for the corner points"""
+        if not corner_points or len(corner_points) != 4:
+            return image_shape[1], image_shape[0]
+
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = corner_points
+        width_out = int(max(math.hypot(x0 - x1, y0 - y1), math.hypot(x3 - x2, y3 - y2)))
+        height_out = int(max(math.hypot(x0 - x3, y0 - y3), math.hypot(x1 - x2, y1 - y2)))
+        return width_out, height_out
+
+    @staticmethod
+    def _compute_edits(image: np.ndarray, corner_points, crop_box):
+        """
+        Apply perspective correction and crop to an image
+
+        Args:
+            image: Original image
+            corner_points: Four (x, y) corners for the perspective transform
+            crop_box: (x1, y1, x2, y2) crop in corrected image coordinates
+
+        Returns:
+            Tuple of (uncropped, edited) images
+        """
+        # Start with original (every step below writes a new buffer or takes a view)
+        result = image
 
         # Apply perspective correction if corners have been modified
-        if self.corner_points and len(self.corner_points) == 4:
+        if corner_points and len(corner_points) == 4:
             # Always apply the perspective transform based on the corner points
-            src_points = np.float32(self.corner_points)
+            src_points = np.asarray(corner_points, dtype=np.float32)
 
             # Calculate output dimensions based on the quadrilateral
-            width_top = np.linalg.norm(np.array(self.corner_points[0]) - np.array(self.corner_points[1]))
-            width_bottom = np.linalg.norm(np.array(self.corner_points[3]) - np.array(self.corner_points[2]))
-            width_out = int(max(width_top, width_bottom))
-
-            height_left = np.linalg.norm(np.array(self.corner_points[0]) - np.array(self.corner_points[3]))
-            height_right = np.linalg.norm(np.array(self.corner_points[1]) - np.array(self.corner_points[2]))
-            height_out = int(max(height_left, height_right))
+            width_out, height_out = ArtEditorScreen._corrected_size(corner_points, image.shape)
 
             result = apply_perspective_correction(result, src_points, width_out, height_out)
 
-        # Store uncropped image for crop mode reference
-        self.uncropped_photo = result.copy()
+        # Return the uncropped image too, for crop mode reference
+        return result, ArtEditorScreen._crop_image(result, crop_box)
 
-        # Apply crop
-        if self.crop_box:
-            x1, y1, x2, y2 = self.crop_box
+    @staticmethod
+    def _crop_image(image: np.ndarray, crop_box) -> np.ndarray:
+        """Get a view of the crop box within an image, or the image itself if there is no valid crop"""
+        if crop_box:
+            x1, y1, x2, y2 = crop_box
             x1, y1 = max(0, int(x1)), max(0, int(y1))
-            x2, y2 = min(result.shape[1], int(x2)), min(result.shape[0], int(y2))
+            x2, y2 = min(image.shape[1], int(x2)), min(image.shape[0], int(y2))
             if x2 > x1 and y2 > y1:
-                result = result[y1:y2, x1:x2]
+                return image[y1:y2, x1:x2]
+        return image
+
+    def _show_welcome(self, text: str):
+        """Hide the editor and show the welcome placeholder with a message"""
+        with self._batch_ui(self.info_panel):
+            if self.editor_container is not None:
+                self.editor_container.pack_forget()
+            self.selected_artwork = None
+
+            if self.welcome_label.cget("text") != text:
+                self.welcome_label.configure(text=text)
+            if not self.welcome_label.winfo_ismapped():
+                self.welcome_label.pack(expand=True)
+
+    def _ensure_editor_ui(self):
+        """Build the editor UI on first use and show it"""
+        if self.editor_container is None:
+            self._setup_editor_ui()
+        elif not self.editor_container.winfo_ismapped():
+            self.editor_container.pack(fill="both", expand=True)
+
+    def _populate_editor_ui(self):
+        """Fill the editor UI with the selected artwork"""
+        artwork = self.selected_artwork
+        self.editor_title.configure(text=f"Editing: {artwork.name}")
+
+        self.mode_var.set("perspective")
+        self._setup_controls()
 
-        self.edited_photo = result
+        self.name_entry.delete(0, "end")
+        self.name_entry.insert(0, artwork.name)
+        self.width_entry.delete(0, "end")
+        self.width_entry.insert(0, f"{artwork.real_width_cm:.1f}")
+        self.height_entry.delete(0, "end")
+        self.height_entry.insert(0, f"{artwork.real_height_cm:.1f}")
+
+        # Render initial preview
+        self._update_canvas_preview()
 
     def _setup_editor_ui(self):
         """Set up the editor UI"""
         main_container = ctk.CTkFrame(self.info_panel)
         main_container.pack(fill="both", expand=True)
+        self.editor_container = main_container
 
         # Title
         title_frame = ctk.CTkFrame(main_container)
         title_frame.pack(fill="x", padx=10, pady=5)
 
-        title = ctk.CTkLabel(
+        self.editor_title = ctk.CTkLabel(
             title_frame,
-            text=f"Editing: {self.selected_artwork.name}",
+            text="",
             font=("Arial", 16, "bold")
         )
-        title.pack(side="left", padx=5)
+        self.editor_title.pack(side="left", padx=5)
 
         # Reset button
         btn_reset = ctk.CTkButton(
@@ -442,13 +805,12 @@ class ArtEditorScreen:
         self.edit_canvas.bind("<Button-1>", self._on_canvas_click)
         self.edit_canvas.bind("<B1-Motion>", self._on_canvas_drag)
         self.edit_canvas.bind("<ButtonRelease-1>", self._on_canvas_release)
+        self.edit_canvas.bind("<Configure>", self._on_canvas_configure)
 
         # Controls panel
         self.controls_frame = ctk.CTkFrame(main_container)
         self.controls_frame.pack(fill="x", padx=10, pady=5)
 
-        self._setup_controls()
-
         # Bottom controls (dimensions, save, delete)
         bottom_frame = ctk.CTkFrame(main_container)
         bottom_frame.pack(fill="x", padx=10, pady=5)
@@ -459,7 +821,6 @@ class ArtEditorScreen:
 
         ctk.CTkLabel(name_section, text="Name:", font=("Arial", 10, "bold")).pack(side="left", padx=5)
         self.name_entry = ctk.CTkEntry(name_section, width=300)
-        self.name_entry.insert(0, self.selected_artwork.name)
         self.name_entry.pack(side="left", padx=5)
 
         # Dimensions
@@ -470,12 +831,10 @@ class ArtEditorScreen:
 
         ctk.CTkLabel(dim_section, text="Width (cm):").pack(side="left", padx=2)
         self.width_entry = ctk.CTkEntry(dim_section, width=80)
-        self.width_entry.insert(0, f"{self.selected_artwork.real_width_cm:.1f}")
         self.width_entry.pack(side="left", padx=2)
 
         ctk.CTkLabel(dim_section, text="Height (cm):").pack(side="left", padx=5)
         self.height_entry = ctk.CTkEntry(dim_section, width=80)
-        self.height_entry.insert(0, f"{self.selected_artwork.real_height_cm:.1f}")
         self.height_entry.pack(side="left", padx=2)
 
         # Buttons
@@ -501,9 +860,6 @@ class ArtEditorScreen:
             fg_color="#F44336"
         ).pack(side="left", padx=5)
 
-        # Render initial preview
-        self._update_canvas_preview()
-
     def _setup_controls(self):
         """Set up mode-specific controls"""
         # Clear existing controls
@@ -628,70 +984,175 @@ class ArtEditorScreen:
         self._setup_controls()
         self._update_canvas_preview()
 
+    def _on_canvas_configure(self, event):
+        """Cache the canvas size and refit the preview once resizing settles"""
+        size = (event.width if event.width > 1 else 600,
+                event.height if event.height > 1 else 400)
+        if size == (self._canvas_w, self._canvas_h):
+            return
+
+        self._canvas_w, self._canvas_h = size
+
+        # Restart the timer on every event so a resize drag rebuilds once at the end
+        if self._resize_job is not None:
+            self.edit_canvas.after_cancel(self._resize_job)
+            self._resize_job = None
+        if self.selected_artwork is not None:
+            self._resize_job = self.edit_canvas.after(50, self._on_resize_settled)
+
+    def _on_resize_settled(self):
+        """Refit the preview to the new canvas size"""
+        self._resize_job = None
+        if self.selected_artwork is not None:
+            self._update_canvas_preview()
+
     def _update_canvas_preview(self):
         """Update the canvas preview"""
         if not hasattr(self, 'edit_canvas'):
             return
 
-        # Get canvas dimensions
-        canvas_width = self.edit_canvas.winfo_width()
-        canvas_height = self.edit_canvas.winfo_height()
+        self._rebuild_preview_bitmap()
+        self._redraw_overlays()
 
-        if canvas_width <= 1:
-            canvas_width = 600
-        if canvas_height <= 1:
-            canvas_height = 400
+    def _preview_state_key(self, canvas_width: int, canvas_height: int) -> tuple:
+        """Key of everything the preview bitmap depends on in the current mode"""
+        mode = self.mode_var.get()
+        key = (mode, canvas_width, canvas_height, self.selected_artwork.art_id)
 
-        # Determine which image to show based on mode
-        if self.mode_var.get() == "perspective":
-            display_img = self.original_photo.copy()
-        elif self.mode_var.get() == "crop":
-            # Show uncropped perspective-corrected image for cropping (allows expanding crop)
-            self._apply_current_edits()
-            display_img = self.uncropped_photo.copy()
-        else:  # adjust
-            # Show final edited image with white balance
-            self._apply_current_edits()
-            display_img = self._apply_white_balance(self.edited_photo)
-
-        # Convert to PIL
-        img_rgb = cv2.cvtColor(display_img, cv2.COLOR_BGR2RGB)
-        pil_img = Image.fromarray(img_rgb)
-
-        # Calculate scale to fit canvas
-        img_width, img_height = pil_img.size
-        scale_w = (canvas_width - 40) / img_width
-        scale_h = (canvas_height - 40) / img_height
-        self.canvas_scale = min(scale_w, scale_h, 1.0)
+        # Perspective mode shows the original; crop mode the corrected, uncropped image
+        if mode != "perspective":
+            key += (tuple(map(tuple, self.corner_points)),)
+        if mode == "adjust":
+            key += (tuple(self.crop_box), self.wb_temperature, self.wb_tint,
+                    self.wb_brightness, self.wb_contrast, self.wb_saturation)
+        return key
 
-        new_width = int(img_width * self.canvas_scale)
-        new_height = int(img_height * self.canvas_scale)
+    def _rebuild_preview_bitmap(self):
+        """Render the preview image for the current mode, skipping the work when nothing changed"""
+        canvas_width, canvas_height = self._canvas_w, self._canvas_h
 
-        pil_img = pil_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        key = self._preview_state_key(canvas_width, canvas_height)
+        if key == self._preview_key:
+            return
+        self._preview_key = key
+
+        # Determine which image to show based on mode, working on the downscaled source
+        mode = self.mode_var.get()
+        if mode == "adjust":
+            # Show final edited image with white balance, applied to the canvas-sized image
+            fitted, scale = self._adjust_preview_source(canvas_width, canvas_height)
+            display_img = self._apply_white_balance(fitted, cache=self._wb_lut_cache)
+        else:
+            # Crop mode shows the uncropped perspective-corrected image (allows expanding crop)
+            source = self._preview_src if mode == "perspective" else self._compute_preview_edits()[0]
+            display_img, scale = self._fit_to_canvas(source, canvas_width, canvas_height, reuse_buffer=True)
 
-        # Convert to PhotoImage
-        self.preview_image = ImageTk.PhotoImage(pil_img)
+        # PIL reads the BGR pixels directly, swapping channels as it unpacks them,
+        # so no separate RGB copy of the preview is made
+        new_height, new_width = display_img.shape[:2]
+        display_img = np.ascontiguousarray(display_img)
+        pil_img = Image.frombuffer('RGB', (new_width, new_height), display_img, 'raw', 'BGR', 0, 1)
 
-        # Clear canvas
-        self.edit_canvas.delete("all")
+        # The scale maps full-resolution pixels to the canvas
+        self.canvas_scale = scale * self._preview_scale
 
         # Center image
         self.canvas_offset_x = (canvas_width - new_width) // 2
         self.canvas_offset_y = (canvas_height - new_height) // 2
 
-        # Draw image
-        self.edit_canvas.create_image(
-            self.canvas_offset_x, self.canvas_offset_y,
-            image=self.preview_image,
-            anchor="nw",
-            tags="preview"
-        )
+        # Update the persistent PhotoImage in place; a new one is only needed when the size changes
+        if (self.preview_image is not None and
+                (self.preview_image.width(), self.preview_image.height()) == (new_width, new_height)):
+            self.preview_image.paste(pil_img)
+        else:
+            self.preview_image = ImageTk.PhotoImage(pil_img)
+            if self._preview_item is not None:
+                self.edit_canvas.itemconfigure(self._preview_item, image=self.preview_image)
+
+        if self._preview_item is None:
+            # Draw image below the overlays
+            self._preview_item = self.edit_canvas.create_image(
+                self.canvas_offset_x, self.canvas_offset_y,
+                image=self.preview_image,
+                anchor="nw",
+                tags="preview"
+            )
+            self.edit_canvas.tag_lower("preview")
+        else:
+            self.edit_canvas.coords(self._preview_item, self.canvas_offset_x, self.canvas_offset_y)
 
-        # Draw overlays based on mode
-        if self.mode_var.get() == "perspective":
-            self._draw_perspective_markers(self.canvas_offset_x, self.canvas_offset_y)
-        elif self.mode_var.get() == "crop":
-            self._draw_crop_markers(self.canvas_offset_x, self.canvas_offset_y)
+    def _fit_to_canvas(self, image: np.ndarray, canvas_width: int, canvas_height: int,
+                       reuse_buffer: bool = False):
+        """
+        Shrink an image to fit the canvas with a margin
+
+        Args:
+            image: Image to fit (BGR)
+            canvas_width: Canvas width in pixels
+            canvas_height: Canvas height in pixels
+            reuse_buffer: Write into the shared resize buffer instead of a new array
+
+        Returns:
+            Tuple of (fitted image, scale applied)
+        """
+        img_height, img_width = image.shape[:2]
+        scale_w = (canvas_width - 40) / img_width
+        scale_h = (canvas_height - 40) / img_height
+        scale = min(scale_w, scale_h, 1.0)
+
+        new_width = int(img_width * scale)
+        new_height = int(img_height * scale)
+        if (new_width, new_height) == (img_width, img_height):
+            return image, scale
+
+        dst = self._get_resize_buffer(new_width, new_height) if reuse_buffer else None
+        return cv2.resize(image, (new_width, new_height), dst=dst, interpolation=cv2.INTER_AREA), scale
+
+    def _adjust_preview_source(self, canvas_width: int, canvas_height: int):
+        """
+        Get the perspective-corrected, cropped preview fitted to the canvas
+
+        It is rebuilt only when the geometry or canvas size changes, so
+        white balance slider ticks skip the warp and resize.
+
+        Returns:
+            Tuple of (fitted image, scale applied)
+        """
+        key = (tuple(map(tuple, self.corner_points)), tuple(self.crop_box), canvas_width, canvas_height)
+        cached = self._adjust_fit
+        if cached is None or cached[0] is not self._preview_src or cached[1] != key:
+            fitted, scale = self._fit_to_canvas(self._compute_preview_edits()[1], canvas_width, canvas_height)
+            self._adjust_fit = (self._preview_src, key, fitted, scale)
+        return self._adjust_fit[2], self._adjust_fit[3]
+
+    def _get_resize_buffer(self, width: int, height: int) -> np.ndarray:
+        """Get the resize buffer for a preview size, reallocating only when it changes"""
+        if self._resize_buf is None or self._resize_buf.shape[:2] != (height, width):
+            self._resize_buf = np.empty((height, width, 3), np.uint8)
+        return self._resize_buf
+
+    def _redraw_overlays(self):
+        """Show and position the markers for the current mode on top of the preview"""
+        mode = self.mode_var.get()
+        show_corners = mode == "perspective" and bool(self.corner_points) and len(self.corner_points) == 4
+        show_crop = mode == "crop" and bool(self.crop_box)
+
+        # Markers are created once, then only moved, shown or hidden
+        for tag, shown in (("corner", show_corners), ("corner_line", show_corners),
+                           ("crop_overlay", show_crop), ("crop_box", show_crop), ("crop_handle", show_crop)):
+            self.edit_canvas.itemconfigure(tag, state="normal" if shown else "hidden")
+        self._canvas_corners = []
+
+        if show_corners:
+            if len(getattr(self, '_corner_oval_ids', ())) == 4:
+                self._move_perspective_markers()
+            else:
+                self._draw_perspective_markers(self.canvas_offset_x, self.canvas_offset_y)
+        elif show_crop:
+            if len(getattr(self, '_crop_handle_ids', ())) == 4:
+                self._move_crop_markers()
+            else:
+                self._draw_crop_markers(self.canvas_offset_x, self.canvas_offset_y)
 
     def _draw_perspective_markers(self, offset_x, offset_y):
         """Draw corner markers for perspective correction"""
@@ -701,132 +1162,211 @@ class ArtEditorScreen:
         colors = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00"]
         labels = ["TL", "TR", "BR", "BL"]
 
-        for i, (x, y) in enumerate(self.corner_points):
-            # Convert to canvas coordinates
-            canvas_x = offset_x + x * self.canvas_scale
-            canvas_y = offset_y + y * self.canvas_scale
+        # Item ids are kept so drags can move markers with coords() instead of redrawing
+        self._corner_oval_ids = []
+        self._corner_label_ids = []
+        self._corner_line_ids = []
 
+        self._update_canvas_corners()
+        for i, (canvas_x, canvas_y) in enumerate(self._canvas_corners):
             # Draw circle
             radius = 8
-            self.edit_canvas.create_oval(
+            self._corner_oval_ids.append(self.edit_canvas.create_oval(
                 canvas_x - radius, canvas_y - radius,
                 canvas_x + radius, canvas_y + radius,
                 fill=colors[i],
                 outline="white",
                 width=2,
                 tags=("corner", f"corner_{i}")
-            )
+            ))
 
             # Draw label
-            self.edit_canvas.create_text(
+            self._corner_label_ids.append(self.edit_canvas.create_text(
                 canvas_x, canvas_y,
                 text=labels[i],
                 fill="black",
                 font=("Arial", 8, "bold"),
                 tags=("corner", f"corner_{i}")
-            )
+            ))
 
-        # Draw lines connecting corners
+        # Draw lines connecting corners (line i runs from corner i to corner i + 1)
         for i in range(4):
-            x1, y1 = self.corner_points[i]
-            x2, y2 = self.corner_points[(i + 1) % 4]
-            self.edit_canvas.create_line(
-                offset_x + x1 * self.canvas_scale,
-                offset_y + y1 * self.canvas_scale,
-                offset_x + x2 * self.canvas_scale,
-                offset_y + y2 * self.canvas_scale,
+            self._corner_line_ids.append(self.edit_canvas.create_line(
+                *self._corner_line_coords(i),
                 fill="#00FF00",
                 width=2,
                 dash=(5, 5),
                 tags="corner_line"
-            )
-
-    def _draw_crop_markers(self, offset_x, offset_y):
-        """Draw crop box with corner handles"""
-        if not self.crop_box:
+            ))
+
+    def _update_canvas_corners(self):
+        """Transform every corner to canvas coordinates at once"""
+        # Positions are cached for the lines, drags and click hit-testing,
+        # leaving the marker loops to issue Tk calls only
+        points = np.asarray(self.corner_points, dtype=np.float64)
+        offset = (self.canvas_offset_x, self.canvas_offset_y)
+        self._canvas_corners = (points * self.canvas_scale + offset).tolist()
+
+    def _move_perspective_markers(self):
+        """Move all existing corner markers and lines to the current corner points"""
+        self._update_canvas_corners()
+
+        radius = 8
+        for i, (canvas_x, canvas_y) in enumerate(self._canvas_corners):
+            self.edit_canvas.coords(self._corner_oval_ids[i],
+                                    canvas_x - radius, canvas_y - radius,
+                                    canvas_x + radius, canvas_y + radius)
+            self.edit_canvas.coords(self._corner_label_ids[i], canvas_x, canvas_y)
+            self.edit_canvas.coords(self._corner_line_ids[i], *self._corner_line_coords(i))
+
+    def _corner_line_coords(self, i: int) -> tuple:
+        """Get canvas coordinates of the line from corner i to the next corner"""
+        return (*self._canvas_corners[i], *self._canvas_corners[(i + 1) % 4])
+
+    def _move_perspective_marker(self, i: int):
+        """Move one corner marker and the two lines touching it"""
+        if len(getattr(self, '_corner_oval_ids', ())) != 4:
+            self._redraw_overlays()
             return
 
-        x1, y1, x2, y2 = self.crop_box
+        x, y = self.corner_points[i]
+        canvas_x = self.canvas_offset_x + x * self.canvas_scale
+        canvas_y = self.canvas_offset_y + y * self.canvas_scale
+        self._canvas_corners[i] = (canvas_x, canvas_y)
+
+        radius = 8
+        self.edit_canvas.coords(self._corner_oval_ids[i],
+                                canvas_x - radius, canvas_y - radius,
+                                canvas_x + radius, canvas_y + radius)
+        self.edit_canvas.coords(self._corner_label_ids[i], canvas_x, canvas_y)
+        self.edit_canvas.coords(self._corner_line_ids[i], *self._corner_line_coords(i))
+        self.edit_canvas.coords(self._corner_line_ids[(i - 1) % 4], *self._corner_line_coords((i - 1) % 4))
+
+    def _crop_marker_coords(self):
+        """
+        Get canvas coordinates of the crop border and handles
+
+        Returns:
+            Tuple of (border rectangle, four handle ovals)
+        """
+        offset_x, offset_y = self.canvas_offset_x, self.canvas_offset_y
 
         # Convert to canvas coordinates
+        x1, y1, x2, y2 = self.crop_box
         canvas_x1 = offset_x + x1 * self.canvas_scale
         canvas_y1 = offset_y + y1 * self.canvas_scale
         canvas_x2 = offset_x + x2 * self.canvas_scale
         canvas_y2 = offset_y + y2 * self.canvas_scale
 
-        # Draw semi-transparent overlay outside crop area
-        # Top
-        self.edit_canvas.create_rectangle(
-            offset_x, offset_y,
-            offset_x + self.preview_image.width(), canvas_y1,
-            fill="#000000",
-            stipple="gray50",
-            tags="crop_overlay"
-        )
-        # Bottom
-        self.edit_canvas.create_rectangle(
-            offset_x, canvas_y2,
-            offset_x + self.preview_image.width(), offset_y + self.preview_image.height(),
-            fill="#000000",
-            stipple="gray50",
-            tags="crop_overlay"
-        )
-        # Left
-        self.edit_canvas.create_rectangle(
-            offset_x, canvas_y1,
-            canvas_x1, canvas_y2,
-            fill="#000000",
-            stipple="gray50",
-            tags="crop_overlay"
-        )
-        # Right
-        self.edit_canvas.create_rectangle(
-            canvas_x2, canvas_y1,
-            offset_x + self.preview_image.width(), canvas_y2,
-            fill="#000000",
-            stipple="gray50",
-            tags="crop_overlay"
-        )
+        border = (canvas_x1, canvas_y1, canvas_x2, canvas_y2)
+
+        handle_size = 12
+        handles = [
+            (cx - handle_size, cy - handle_size, cx + handle_size, cy + handle_size)
+            for cx, cy in ((canvas_x1, canvas_y1), (canvas_x2, canvas_y1),
+                           (canvas_x2, canvas_y2), (canvas_x1, canvas_y2))
+        ]
+        return border, handles
+
+    def _draw_crop_markers(self, offset_x, offset_y):
+        """Draw crop box with corner handles"""
+        if not self.crop_box:
+            return
+
+        border, handles = self._crop_marker_coords()
+
+        # Dim everything outside the crop area
+        self._update_crop_mask(border)
 
         # Draw crop rectangle border
-        self.edit_canvas.create_rectangle(
-            canvas_x1, canvas_y1,
-            canvas_x2, canvas_y2,
+        self._crop_box_id = self.edit_canvas.create_rectangle(
+            *border,
             outline="#00FF00",
             width=3,
             tags="crop_box"
         )
 
         # Draw corner handles - larger and more visible
-        handle_size = 12
-        corners = [
-            (canvas_x1, canvas_y1, "nw"),
-            (canvas_x2, canvas_y1, "ne"),
-            (canvas_x2, canvas_y2, "se"),
-            (canvas_x1, canvas_y2, "sw")
-        ]
-
-        for cx, cy, tag in corners:
-            # Outer circle
+        self._crop_handle_ids = [
             self.edit_canvas.create_oval(
-                cx - handle_size, cy - handle_size,
-                cx + handle_size, cy + handle_size,
+                *handle,
                 fill="#00FF00",
                 outline="white",
                 width=3,
                 tags=("crop_handle", f"crop_{tag}")
             )
+            for handle, tag in zip(handles, ("nw", "ne", "se", "sw"))
+        ]
+
+    def _update_crop_mask(self, border):
+        """
+        Paste the dimmed mask with a transparent hole over the crop area
+
+        Args:
+            border: Crop rectangle in canvas coordinates
+        """
+        dim = (0, 0, 0, 128)
+        size = (self.preview_image.width(), self.preview_image.height())
+        if self._crop_overlay_mask is None or self._crop_overlay_mask.size != size:
+            self._crop_overlay_mask = Image.new('RGBA', size, dim)
+            self._crop_overlay_hole = None
+            self._crop_overlay_photo = ImageTk.PhotoImage(self._crop_overlay_mask)
+            if self._crop_overlay_item is not None:
+                self.edit_canvas.itemconfigure(self._crop_overlay_item, image=self._crop_overlay_photo)
+
+        # Move the hole within the one mask: re-dim the old box, then clear the new one
+        x1, y1, x2, y2 = (int(round(v)) for v in border)
+        x1 = max(0, x1 - self.canvas_offset_x)
+        y1 = max(0, y1 - self.canvas_offset_y)
+        x2 = min(size[0], x2 - self.canvas_offset_x)
+        y2 = min(size[1], y2 - self.canvas_offset_y)
+        hole = (x1, y1, x2, y2) if x2 > x1 and y2 > y1 else None
+
+        if hole != self._crop_overlay_hole:
+            if self._crop_overlay_hole is not None:
+                self._crop_overlay_mask.paste(dim, self._crop_overlay_hole)
+            if hole is not None:
+                self._crop_overlay_mask.paste((0, 0, 0, 0), hole)
+            self._crop_overlay_hole = hole
+            self._crop_overlay_photo.paste(self._crop_overlay_mask)
+
+        if self._crop_overlay_item is None:
+            self._crop_overlay_item = self.edit_canvas.create_image(
+                self.canvas_offset_x, self.canvas_offset_y,
+                image=self._crop_overlay_photo,
+                anchor="nw",
+                tags="crop_overlay"
+            )
+        else:
+            self.edit_canvas.coords(self._crop_overlay_item, self.canvas_offset_x, self.canvas_offset_y)
+            self.edit_canvas.itemconfigure(self._crop_overlay_item, state="normal")
+
+        # Keep the mask directly above the preview and below the border and handles
+        self.edit_canvas.tag_raise(self._crop_overlay_item, "preview")
+
+    def _move_crop_markers(self):
+        """Move the existing crop overlay, border and handles to the current crop box"""
+        if len(getattr(self, '_crop_handle_ids', ())) != 4:
+            self._redraw_overlays()
+            return
+
+        border, handles = self._crop_marker_coords()
+        self._update_crop_mask(border)
+        self.edit_canvas.coords(self._crop_box_id, *border)
+        for item, handle in zip(self._crop_handle_ids, handles):
+            self.edit_canvas.coords(item, *handle)
 
     def _on_canvas_click(self, event):
         """Handle canvas click"""
         if self.mode_var.get() == "perspective":
             # Check if clicking on a corner
             radius = 15
-            for i, (x, y) in enumerate(self.corner_points):
-                canvas_x = self.canvas_offset_x + x * self.canvas_scale
-                canvas_y = self.canvas_offset_y + y * self.canvas_scale
-
-                if abs(event.x - canvas_x) < radius and abs(event.y - canvas_y) < radius:
+            radius_sq = radius * radius
+            for i, (canvas_x, canvas_y) in enumerate(self._canvas_corners):
+                dx = event.x - canvas_x
+                dy = event.y - canvas_y
+                # Cheap box test first, then the exact circle
+                if -radius < dx < radius and -radius < dy < radius and dx * dx + dy * dy < radius_sq:
                     self.dragging_point = i
                     return
 
@@ -841,6 +1381,7 @@ class ArtEditorScreen:
 
                 # Larger click radius for easier grabbing
                 handle_size = 20
+                handle_size_sq = handle_size * handle_size
                 corners = [
                     (canvas_x1, canvas_y1, "nw"),
                     (canvas_x2, canvas_y1, "ne"),
@@ -849,8 +1390,10 @@ class ArtEditorScreen:
                 ]
 
                 for cx, cy, tag in corners:
-                    dist = ((event.x - cx) ** 2 + (event.y - cy) ** 2) ** 0.5
-                    if dist < handle_size:
+                    dx = event.x - cx
+                    dy = event.y - cy
+                    if (-handle_size < dx < handle_size and -handle_size < dy < handle_size
+                            and dx * dx + dy * dy < handle_size_sq):
                         self.dragging_crop = tag
                         return
 
@@ -867,7 +1410,8 @@ class ArtEditorScreen:
             img_y = max(0, min(height, img_y))
 
             self.corner_points[self.dragging_point] = (img_x, img_y)
-            self._update_canvas_preview()
+            self._drag_moved_point = self.dragging_point
+            self._schedule_drag_redraw()
 
         elif self.mode_var.get() == "crop" and self.dragging_crop:
             # Convert to image coordinates
@@ -875,38 +1419,22 @@ class ArtEditorScreen:
             img_y = (event.y - self.canvas_offset_y) / self.canvas_scale
 
             # Clamp to uncropped image bounds (allows expanding crop box)
-            if self.uncropped_photo is not None:
-                height, width = self.uncropped_photo.shape[:2]
-            else:
-                height, width = self.edited_photo.shape[:2]
+            width, height = self._corrected_size(self.corner_points, self.original_photo.shape)
             img_x = max(0, min(width, img_x))
             img_y = max(0, min(height, img_y))
 
             x1, y1, x2, y2 = self.crop_box
+            min_size = 10  # Minimum crop size in pixels
 
-            # Update the appropriate corner
-            if self.dragging_crop == "nw":
-                x1, y1 = img_x, img_y
-            elif self.dragging_crop == "ne":
-                x2, y1 = img_x, img_y
-            elif self.dragging_crop == "se":
-                x2, y2 = img_x, img_y
-            elif self.dragging_crop == "sw":
-                x1, y2 = img_x, img_y
-
-            # Ensure minimum crop size (10 pixels)
-            min_size = 10
-            if x2 - x1 < min_size:
-                if self.dragging_crop in ["nw", "sw"]:
-                    x1 = x2 - min_size
-                else:
-                    x2 = x1 + min_size
-
-            if y2 - y1 < min_size:
-                if self.dragging_crop in ["nw", "ne"]:
-                    y1 = y2 - min_size
-                else:
-                    y2 = y1 + min_size
+            # Move the dragged corner, keeping it at least min_size from the opposite edges
+            if self.dragging_crop in ("nw", "sw"):
+                x1 = min(img_x, x2 - min_size)
+            else:
+                x2 = max(img_x, x1 + min_size)
+            if self.dragging_crop in ("nw", "ne"):
+                y1 = min(img_y, y2 - min_size)
+            else:
+                y2 = max(img_y, y1 + min_size)
 
             # Clamp again after adjustments
             x1 = max(0, min(width - min_size, x1))
@@ -915,7 +1443,21 @@ class ArtEditorScreen:
             y2 = max(min_size, min(height, y2))
 
             self.crop_box = (x1, y1, x2, y2)
-            self._update_canvas_preview()
+            self._schedule_drag_redraw()
+
+    def _schedule_drag_redraw(self):
+        """Queue one marker move for idle time, coalescing rapid motion events"""
+        if not self._drag_redraw_pending:
+            self._drag_redraw_pending = True
+            self.edit_canvas.after_idle(self._do_drag_redraw)
+
+    def _do_drag_redraw(self):
+        """Move the dragged markers to their latest position"""
+        self._drag_redraw_pending = False
+        if self.mode_var.get() == "perspective" and self._drag_moved_point is not None:
+            self._move_perspective_marker(self._drag_moved_point)
+        elif self.mode_var.get() == "crop":
+            self._move_crop_markers()
 
     def _on_canvas_release(self, event):
         """Handle mouse release"""
@@ -924,9 +1466,8 @@ class ArtEditorScreen:
 
     def _apply_perspective(self):
         """Apply perspective correction"""
-        self._apply_current_edits()
         # Reset crop box to full corrected image
-        height, width = self.edited_photo.shape[:2]
+        width, height = self._corrected_size(self.corner_points, self.original_photo.shape)
         self.crop_box = (0, 0, width, height)
 
         # Switch to crop mode to show the result
@@ -937,51 +1478,123 @@ class ArtEditorScreen:
 
     def _apply_crop(self):
         """Apply crop"""
-        self._apply_current_edits()
         self._update_canvas_preview()
         self.app._show_info("Crop applied")
 
-    def _apply_white_balance(self, image: np.ndarray) -> np.ndarray:
-        """Apply white balance adjustments to image"""
-        # Convert to PIL for easier adjustment
-        img_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        pil_img = Image.fromarray(img_rgb)
-
-        # Apply brightness
-        if self.wb_brightness != 0:
-            factor = 1.0 + (self.wb_brightness / 100.0)
-            enhancer = ImageEnhance.Brightness(pil_img)
-            pil_img = enhancer.enhance(factor)
-
-        # Apply contrast
-        if self.wb_contrast != 0:
-            factor = 1.0 + (self.wb_contrast / 100.0)
-            enhancer = ImageEnhance.Contrast(pil_img)
-            pil_img = enhancer.enhance(factor)
-
-        # Apply saturation
-        if self.wb_saturation != 0:
-            factor = 1.0 + (self.wb_saturation / 100.0)
-            enhancer = ImageEnhance.Color(pil_img)
-            pil_img = enhancer.enhance(factor)
-
-        # Convert back to numpy for temperature and tint
-        result = np.array(pil_img)
-
-        # Apply temperature (shift blue-yellow)
-        if self.wb_temperature != 0:
-            temp_shift = self.wb_temperature / 100.0 * 30
-            result[:, :, 0] = np.clip(result[:, :, 0] + temp_shift, 0, 255)  # R
-            result[:, :, 2] = np.clip(result[:, :, 2] - temp_shift, 0, 255)  # B
-
-        # Apply tint (shift green-magenta)
-        if self.wb_tint != 0:
-            tint_shift = self.wb_tint / 100.0 * 30
-            result[:, :, 1] = np.clip(result[:, :, 1] + tint_shift, 0, 255)  # G
-
-        # Convert back to BGR
-        result = cv2.cvtColor(result, cv2.COLOR_RGB2BGR)
-        return result
+    def _apply_white_balance(self, image: np.ndarray, wb: dict = None, cache: dict = None) -> np.ndarray:
+        """
+        Apply white balance adjustments to image
+
+        Brightness, contrast, temperature and tint are per-channel and are
+        baked into lookup tables, so the image is only passed over once
+        (three times with saturation, which mixes channels, or once with numba).
+
+        Args:
+            image: Input image (BGR)
+            wb: White balance settings, the current slider values if None
+            cache: Lookup tables to reuse across calls, or None to build them fresh;
+                   only the UI thread passes one, so workers never share it
+
+        Returns:
+            Adjusted image (BGR)
+        """
+        if wb is None:
+            wb = self._white_balance_settings()
+        if not any(wb.values()):
+            return image
+
+        # Contrast pivots on the mean grey level after brightness, like ImageEnhance.Contrast
+        mean = self._wb_contrast_mean(image, wb['brightness']) if wb['contrast'] != 0 else 0
+
+        key = (*wb.values(), mean)
+        luts = cache.get(key) if cache is not None else None
+        if luts is None:
+            luts = self._build_wb_luts(wb, mean)
+            if cache is not None:
+                cache.clear()
+                cache[key] = luts
+        tone_lut, shift_lut, combined_lut = luts
+
+        if wb['saturation'] == 0:
+            return cv2.LUT(image, combined_lut)
+
+        # Saturation blends each pixel with its grey value, like ImageEnhance.Color
+        factor = 1.0 + (wb['saturation'] / 100.0)
+        if color_kernels.NUMBA_AVAILABLE:
+            # One fused pass instead of three lookups, two conversions and a blend
+            return color_kernels.apply_tone_saturation_shift(image, tone_lut, shift_lut[0], factor)
+
+        # The grey blend is linear in B, G and R, so it is one 3x3 color matrix
+        # applied straight to the uint8 pixels, with no grey image in between
+        matrix = factor * np.eye(3) + (1.0 - factor) * self._GREY_WEIGHTS
+        result = cv2.transform(cv2.LUT(image, tone_lut), matrix)
+        return cv2.LUT(result, shift_lut)
+
+    def _white_balance_settings(self) -> dict:
+        """Get the current white balance slider values"""
+        return {
+            'temperature': self.wb_temperature,
+            'tint': self.wb_tint,
+            'brightness': self.wb_brightness,
+            'contrast': self.wb_contrast,
+            'saturation': self.wb_saturation
+        }
+
+    @staticmethod
+    def _brightness_tone(brightness: float) -> np.ndarray:
+        """Get the brightness curve over all 256 input levels"""
+        tone = np.arange(256, dtype=np.float64)
+        if brightness != 0:
+            tone = np.floor(np.clip(tone * (1.0 + brightness / 100.0), 0, 255))
+        return tone
+
+    @staticmethod
+    def _wb_contrast_mean(image: np.ndarray, brightness: float) -> int:
+        """Get the mean grey level of the image after brightness, from channel histograms"""
+        tone = ArtEditorScreen._brightness_tone(brightness)
+        pixels = image.shape[0] * image.shape[1]
+        if color_kernels.NUMBA_AVAILABLE:
+            hists = color_kernels.channel_histograms(image)
+        else:
+            hists = [cv2.calcHist([image], [channel], None, [256], [0, 256]).ravel()
+                     for channel in range(3)]
+        b, g, r = (float(hist @ tone) / pixels for hist in hists)
+        return int(0.299 * r + 0.587 * g + 0.114 * b + 0.5)
+
+    @staticmethod
+    def _build_wb_luts(wb: dict, mean: int):
+        """
+        Build the white balance lookup tables
+
+        Args:
+            wb: White balance settings
+            mean: Grey level contrast pivots on
+
+        Returns:
+            Tuple of (tone LUT, per-channel shift LUT, tone and shift combined LUT)
+        """
+        # Brightness then contrast, the same curve for every channel
+        tone = ArtEditorScreen._brightness_tone(wb['brightness'])
+        if wb['contrast'] != 0:
+            factor = 1.0 + (wb['contrast'] / 100.0)
+            tone = np.floor(np.clip(mean + factor * (tone - mean), 0, 255))
+        tone_lut = tone.astype(np.uint8)
+
+        # Temperature shifts red against blue, tint shifts green
+        # Levels are whole numbers, so flooring each shift once keeps the tables
+        # in integer arithmetic with the same result as shifting every level
+        temp_shift = wb['temperature'] / 100.0 * 30
+        tint_shift = wb['tint'] / 100.0 * 30
+        levels = np.arange(256, dtype=np.int16)
+        shift = [
+            np.clip(levels + math.floor(-temp_shift), 0, 255).astype(np.uint8),  # B
+            np.clip(levels + math.floor(tint_shift), 0, 255).astype(np.uint8),   # G
+            np.clip(levels + math.floor(temp_shift), 0, 255).astype(np.uint8)    # R
+        ]
+
+        shift_lut = np.dstack(shift)
+        combined_lut = np.dstack([channel[tone_lut] for channel in shift])
+        return tone_lut, shift_lut, combined_lut
 
     def _on_wb_change(self, value=None):
         """Handle white balance slider change"""
@@ -1005,7 +1618,18 @@ class ArtEditorScreen:
             self.wb_saturation = self.sat_slider.get()
             self.sat_label.configure(text=f"{self.wb_saturation:.0f}")
 
-        self._update_canvas_preview()
+        self._schedule_preview_update()
+
+    def _schedule_preview_update(self):
+        """Queue one preview rebuild in 30 ms, coalescing slider events in between"""
+        if self._preview_after_id is None:
+            self._preview_after_id = self.edit_canvas.after(30, self._do_preview_update)
+
+    def _do_preview_update(self):
+        """Run the queued preview rebuild"""
+        self._preview_after_id = None
+        if self.selected_artwork is not None:
+            self._update_canvas_preview()
 
     def _reset_white_balance(self):
         """Reset white balance to defaults"""
@@ -1036,7 +1660,6 @@ class ArtEditorScreen:
         ]
         self.crop_box = (0, 0, width, height)
         self._reset_white_balance()
-        self._apply_current_edits()
         self._update_canvas_preview()
         self.app._show_info("All edits reset")
 
@@ -1062,28 +1685,72 @@ class ArtEditorScreen:
             return
 
         # Save editing state
-        self.selected_artwork.corner_points = self.corner_points.copy()
-        self.selected_artwork.crop_box = self.crop_box
-        self.selected_artwork.white_balance_adjustments = {
-            'temperature': self.wb_temperature,
-            'tint': self.wb_tint,
-            'brightness': self.wb_brightness,
-            'contrast': self.wb_contrast,
-            'saturation': self.wb_saturation
-        }
+        artwork = self.selected_artwork
+        artwork.corner_points = self.corner_points.copy()
+        artwork.crop_box = self.crop_box
+        artwork.white_balance_adjustments = self._white_balance_settings()
+
+        # Render the full-resolution result on a worker so the UI stays responsive
+        generation = _SAVE_GENERATIONS.get(artwork.art_id, 0) + 1
+        _SAVE_GENERATIONS[artwork.art_id] = generation
+        future = self._io_pool.submit(
+            self._render_final_image, self.original_photo, artwork.corner_points,
+            artwork.crop_box, artwork.white_balance_adjustments
+        )
+        self._poll_save(artwork, future, generation)
+
+    def _render_final_image(self, image: np.ndarray, corner_points, crop_box, wb: dict):
+        """
+        Apply all edits at full resolution (runs on a worker thread)
+
+        Args:
+            image: Original image
+            corner_points: Four (x, y) corners for the perspective transform
+            crop_box: (x1, y1, x2, y2) crop in corrected image coordinates
+            wb: White balance settings
 
-        # Apply final edits and update artwork image
-        self._apply_current_edits()
-        final_image = self._apply_white_balance(self.edited_photo)
-        self.app.artwork_images[self.selected_artwork.art_id] = final_image
+        Returns:
+            Tuple of (final image, PIL thumbnail)
+        """
+        edited = self._compute_edits(image, corner_points, crop_box)[1]
+
+        # Own the pixels so the stored image does not keep the uncropped buffer alive
+        final_image = self._apply_white_balance(edited, wb)
+        if final_image.base is not None:
+            final_image = final_image.copy()
+        return final_image, ImageProcessor.make_thumbnail(final_image, 60)
+
+    def _poll_save(self, artwork: Artwork, future, generation: int):
+        """Store the rendered image and thumbnail once the save worker finishes"""
+        if not future.done():
+            self.parent.after(30, self._poll_save, artwork, future, generation)
+            return
+
+        # A newer save of this artwork supersedes this one, even if it finished first
+        if generation != _SAVE_GENERATIONS.get(artwork.art_id):
+            return
+
+        try:
+            final_image, thumbnail = future.result()
+        except Exception as e:
+            print(f"Error saving artwork: {e}")
+            self.app._show_error(f"Failed to save changes for '{artwork.name}'")
+            return
+
+        # The artwork may have been deleted while it was rendering
+        if artwork not in self.app.artworks:
+            return
+
+        self.app.artwork_images[artwork.art_id] = final_image
+        self._create_thumbnail(artwork.art_id, final_image, thumbnail=thumbnail)
 
-        # Update thumbnail
-        self._create_thumbnail(self.selected_artwork.art_id, final_image)
+        # The user may have left the editor while the save was rendering
+        if not self.artwork_list_frame.winfo_exists():
+            return
 
-        # Refresh list
         self._refresh_artwork_list()
 
-        self.app._show_info(f"Changes saved for '{self.selected_artwork.name}'")
+        self.app._show_info(f"Changes saved for '{artwork.name}'")
 
     def _delete_artwork(self, artwork: Artwork):
         """Delete an artwork"""
@@ -1092,25 +1759,17 @@ class ArtEditorScreen:
         if messagebox.askyesno("Confirm Delete", f"Delete '{artwork.name}'?"):
             # Remove from app
             self.app.artworks.remove(artwork)
+            self.app.artworks_by_id.pop(artwork.art_id, None)
             if artwork.art_id in self.app.artwork_images:
                 del self.app.artwork_images[artwork.art_id]
             if artwork.art_id in self.thumbnail_images:
                 del self.thumbnail_images[artwork.art_id]
+            _THUMB_CACHE.pop(artwork.art_id, None)
 
             # Refresh and show welcome
             self._refresh_artwork_list()
 
-            # Clear info panel
-            for widget in self.info_panel.winfo_children():
-                widget.destroy()
-
-            welcome = ctk.CTkLabel(
-                self.info_panel,
-                text="Select an artwork to edit",
-                font=("Arial", 14),
-                text_color="gray"
-            )
-            welcome.pack(expand=True)
+            self._show_welcome("Select an artwork to edit")
 
             self.app._show_info(f"'{artwork.name}' deleted")
 
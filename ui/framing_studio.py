@@ -7,8 +7,14 @@ from models.frame import FrameConfig, MatConfig, FrameTemplate
 from processors.frame_renderer import FrameRenderer
 from utils.template_manager import TemplateManager
 from PIL import Image, ImageTk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import config
 
+PREVIEW_MAX_SIZE = 500  # Longest side of the displayed preview in pixels
+PREVIEW_SCALE = 10.0  # Pixels per cm for preview renders
+PREVIEW_CACHE_SIZE = 32  # Rendered previews kept for revisiting earlier settings
+
 
 class FramingStudioScreen:
     """Screen for configuring frames and mats"""
@@ -27,14 +33,24 @@ class FramingStudioScreen:
         # State
         self.selected_artwork = None if len(app.artworks) == 0 else app.artworks[0]
         self.current_frame_config = None
+        self._preview_after_id = None  # Pending debounced preview render
+        self._preview_cache = OrderedDict()  # key -> (source image, display image), oldest first
+        self._render_pool = ThreadPoolExecutor(max_workers=1)  # Renders previews off the Tk thread
+        self._preview_request = 0  # Id of the latest preview request; older results are not shown
+        self._preview_future = None  # Render queued or running for the latest request
+        self._last_preview = None  # (key, source image) of the preview last shown or requested
+        self._preview_canvas = None  # PREVIEW_MAX_SIZE square RGBA image the preview is centered on
+        self._preview_photo = None  # PhotoImage shown in the preview label, updated in place
 
         # Template manager
         self.template_manager = TemplateManager()
 
+        self._setup_ui()
+
+        # Load the artwork's frame into the controls once they exist, then render once
         if self.selected_artwork:
             self._init_frame_config()
-
-        self._setup_ui()
+            self._update_preview()
 
     def _init_frame_config(self):
         """Initialize frame configuration for selected artwork"""
@@ -112,6 +128,7 @@ class FramingStudioScreen:
         self.list_frame = ctk.CTkScrollableFrame(parent)
         self.list_frame.pack(fill="both", expand=True, padx=5, pady=5)
 
+        self._artwork_buttons = {}  # art_id -> list button, in list order
         self._refresh_artwork_list()
 
         # Bottom buttons
@@ -141,10 +158,6 @@ class FramingStudioScreen:
         )
         self.preview_label.pack(fill="both", expand=True, padx=20, pady=20)
 
-        # Initial preview
-        if self.selected_artwork:
-            self._update_preview()
-
     def _setup_controls(self, parent):
         """Set up framing controls"""
         title = ctk.CTkLabel(parent, text="Frame Settings", font=("Arial", 14, "bold"))
@@ -173,7 +186,7 @@ class FramingStudioScreen:
 
         self.mat_width_entry = ctk.CTkEntry(controls_frame, width=150)
         self.mat_width_entry.insert(0, "3.0")
-        self.mat_width_entry.bind('<KeyRelease>', lambda e: self._update_preview())
+        self.mat_width_entry.bind('<KeyRelease>', self._schedule_preview)
         self.mat_width_entry.pack(pady=5)
 
         # Mat color
@@ -196,7 +209,7 @@ class FramingStudioScreen:
 
         self.frame_width_entry = ctk.CTkEntry(controls_frame, width=150)
         self.frame_width_entry.insert(0, "2.0")
-        self.frame_width_entry.bind('<KeyRelease>', lambda e: self._update_preview())
+        self.frame_width_entry.bind('<KeyRelease>', self._schedule_preview)
         self.frame_width_entry.pack(pady=5)
 
         # Frame color
@@ -218,7 +231,7 @@ class FramingStudioScreen:
             controls_frame,
             text="Frame Shadow",
             variable=self.frame_shadow_var,
-            command=self._update_preview
+            command=self._schedule_preview
         )
         frame_shadow_check.pack(pady=5)
 
@@ -227,7 +240,7 @@ class FramingStudioScreen:
             controls_frame,
             text="Mat Shadow",
             variable=self.mat_shadow_var,
-            command=self._update_preview
+            command=self._schedule_preview
         )
         mat_shadow_check.pack(pady=5)
 
@@ -302,21 +315,41 @@ class FramingStudioScreen:
         btn_apply.pack(pady=5, fill="x")
 
     def _refresh_artwork_list(self):
-        """Refresh the artwork list"""
-        # Clear existing
-        for widget in self.list_frame.winfo_children():
-            widget.destroy()
+        """Refresh the artwork list, only touching buttons whose artwork changed"""
+        wanted = [artwork.art_id for artwork in self.app.artworks]
 
-        # Add artwork buttons
+        # Remove buttons for artworks that are gone
+        for art_id in set(self._artwork_buttons) - set(wanted):
+            self._artwork_buttons.pop(art_id).destroy()
+
+        # Update labels in place and add buttons for new artworks
+        added = False
         for artwork in self.app.artworks:
-            # Add indicator if artwork has frame
-            frame_indicator = " [Framed]" if artwork.frame_config else ""
-            btn = ctk.CTkButton(
-                self.list_frame,
-                text=f"{artwork.name}{frame_indicator}",
-                command=lambda a=artwork: self._select_artwork(a)
-            )
-            btn.pack(fill="x", pady=2, padx=2)
+            btn = self._artwork_buttons.get(artwork.art_id)
+            text = self._artwork_label(artwork)
+            if btn is None:
+                self._artwork_buttons[artwork.art_id] = ctk.CTkButton(
+                    self.list_frame,
+                    text=text,
+                    command=lambda a=artwork: self._select_artwork(a)
+                )
+                added = True
+            elif btn.cget("text") != text:
+                btn.configure(text=text)
+
+        # Repack only when buttons were added or the order no longer matches the artwork list
+        if added or list(self._artwork_buttons) != wanted:
+            for btn in self._artwork_buttons.values():
+                btn.pack_forget()
+            self._artwork_buttons = {art_id: self._artwork_buttons[art_id] for art_id in wanted}
+            for btn in self._artwork_buttons.values():
+                btn.pack(fill="x", pady=2, padx=2)
+
+    @staticmethod
+    def _artwork_label(artwork) -> str:
+        """List button text for an artwork, with an indicator if it has a frame"""
+        frame_indicator = " [Framed]" if artwork.frame_config else ""
+        return f"{artwork.name}{frame_indicator}"
 
     def _select_artwork(self, artwork):
         """Select artwork for framing"""
@@ -326,7 +359,19 @@ class FramingStudioScreen:
 
     def _on_mat_enabled_changed(self):
         """Handle mat enabled checkbox change"""
-        self._update_preview()
+        self._schedule_preview()
+
+    def _schedule_preview(self, *_):
+        """Render the preview 120 ms after the last edit, restarting the wait on each event"""
+        if self._preview_after_id is not None:
+            self.parent.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.parent.after(120, self._run_scheduled_preview)
+
+    def _run_scheduled_preview(self):
+        """Run the debounced preview render"""
+        self._preview_after_id = None
+        if self.preview_label.winfo_exists():
+            self._update_preview()
 
     def _choose_mat_color(self):
         """Choose mat color"""
@@ -346,7 +391,13 @@ class FramingStudioScreen:
 
     def _update_preview(self):
         """Update preview with current frame configuration"""
+        # A direct update replaces any debounced one still waiting
+        if self._preview_after_id is not None:
+            self.parent.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+
         if not self.selected_artwork:
+            self._supersede_preview()
             self.preview_label.configure(
                 text="Select artwork to preview",
                 image=None,
@@ -357,6 +408,7 @@ class FramingStudioScreen:
         # Check if artwork image exists
         artwork_image = self.app.artwork_images.get(self.selected_artwork.art_id)
         if artwork_image is None:
+            self._supersede_preview()
             self.preview_label.configure(
                 text=f"Image not found for:\n{self.selected_artwork.name}",
                 image=None,
@@ -388,37 +440,148 @@ class FramingStudioScreen:
                 mat_shadow_enabled=self.mat_shadow_var.get() if hasattr(self, 'mat_shadow_var') else True
             )
 
-            # Use moderate scale for preview
-            scale = 10.0  # 10 pixels per cm
+            key = (
+                self.selected_artwork.art_id,
+                self.selected_artwork.real_width_cm,
+                self.selected_artwork.real_height_cm,
+                frame_width,
+                mat_width if mat_config else None,
+                mat_config.color if mat_config else None,
+                frame_config.frame_color,
+                frame_config.frame_shadow_enabled,
+                frame_config.mat_shadow_enabled,
+                PREVIEW_SCALE,
+                PREVIEW_MAX_SIZE
+            )
 
-            framed_img = FrameRenderer.render_framed_artwork(
+            # Nothing changed, e.g. an arrow or shift key; the current preview already matches
+            if (self._last_preview is not None and self._last_preview[0] == key
+                    and self._last_preview[1] is artwork_image):
+                return
+            self._supersede_preview()
+            self._last_preview = (key, artwork_image)
+
+            # Reuse an earlier render if the artwork image has not been replaced since
+            cached = self._preview_cache.get(key)
+            if cached is not None and cached[0] is artwork_image:
+                self._preview_cache.move_to_end(key)
+                self._show_preview_image(cached[1])
+                return
+
+            self._preview_future = self._render_pool.submit(
+                self._render_preview_image,
                 artwork_image,
                 self.selected_artwork.real_width_cm,
                 self.selected_artwork.real_height_cm,
-                frame_config,
-                scale
+                frame_config
             )
-
-            # Resize for display if too large
-            max_size = 500
-            if framed_img.width > max_size or framed_img.height > max_size:
-                ratio = min(max_size / framed_img.width, max_size / framed_img.height)
-                new_size = (int(framed_img.width * ratio), int(framed_img.height * ratio))
-                framed_img = framed_img.resize(new_size, Image.Resampling.LANCZOS)
-
-            # Convert to PhotoImage and display
-            photo = ImageTk.PhotoImage(framed_img)
-            self.preview_label.configure(image=photo, text="")
-            self.preview_label.image = photo  # Keep a reference
+            self.parent.after(30, self._poll_preview, self._preview_request, key,
+                              artwork_image, self._preview_future)
 
         except Exception as e:
             print(f"Error updating preview: {e}")
+            self._supersede_preview()
             self.preview_label.configure(
                 text=f"Error rendering preview:\n{str(e)}",
                 image=None,
                 text_color="red"
             )
 
+    def _supersede_preview(self):
+        """Drop the pending render so its result is not shown, and forget the shown settings"""
+        self._preview_request += 1
+        self._last_preview = None
+        if self._preview_future is not None:
+            self._preview_future.cancel()  # Only stops renders that have not started yet
+            self._preview_future = None
+
+    def _poll_preview(self, request_id: int, key: tuple, artwork_image, future):
+        """Cache a finished preview render and show it if it is still the latest request"""
+        if future.cancelled():
+            return
+        if not future.done():
+            self.parent.after(30, self._poll_preview, request_id, key, artwork_image, future)
+            return
+
+        if not self.preview_label.winfo_exists():
+            return
+        stale = request_id != self._preview_request
+
+        try:
+            framed_img = future.result()
+        except Exception as e:
+            if not stale:
+                print(f"Error updating preview: {e}")
+                self._last_preview = None  # Let the next event retry
+                self.preview_label.configure(
+                    text=f"Error rendering preview:\n{str(e)}",
+                    image=None,
+                    text_color="red"
+                )
+            return
+
+        # Superseded renders are still worth keeping for when the user toggles back
+        self._preview_cache[key] = (artwork_image, framed_img)
+        if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+
+        if not stale:
+            self._preview_future = None
+            self._show_preview_image(framed_img)
+
+    def _show_preview_image(self, framed_img: Image.Image):
+        """Display a rendered preview in the preview label"""
+        if self._preview_photo is None:
+            self._preview_canvas = Image.new('RGBA', (PREVIEW_MAX_SIZE, PREVIEW_MAX_SIZE))
+            self._preview_photo = ImageTk.PhotoImage(self._preview_canvas)
+
+        # Center the render on a cleared square and upload it into the existing photo
+        self._preview_canvas.paste((0, 0, 0, 0), (0, 0, PREVIEW_MAX_SIZE, PREVIEW_MAX_SIZE))
+        self._preview_canvas.paste(framed_img, ((PREVIEW_MAX_SIZE - framed_img.width) // 2,
+                                                (PREVIEW_MAX_SIZE - framed_img.height) // 2))
+        self._preview_photo.paste(self._preview_canvas)
+
+        self.preview_label.configure(image=self._preview_photo, text="")
+        self.preview_label.image = self._preview_photo  # Keep a reference
+
+    @staticmethod
+    def _render_preview_image(artwork_image, width_cm: float, height_cm: float,
+                              frame_config: FrameConfig) -> Image.Image:
+        """
+        Render the framed artwork at the scale that fits the preview size
+
+        Args:
+            artwork_image: Artwork image as numpy array (BGR)
+            width_cm: Real-world artwork width in cm
+            height_cm: Real-world artwork height in cm
+            frame_config: Frame configuration
+
+        Returns:
+            Framed artwork as PIL Image, at most PREVIEW_MAX_SIZE on its longest side
+        """
+        # Pick the scale up front so the renderer never builds pixels that are shrunk away
+        total_w_cm, total_h_cm = FrameRenderer.calculate_total_dimensions(width_cm, height_cm, frame_config)
+        available_px = PREVIEW_MAX_SIZE
+        if frame_config.frame_shadow_enabled:
+            available_px -= int(frame_config.frame_shadow_blur * 4)  # Drop shadow margin
+        scale = min(PREVIEW_SCALE, max(available_px, 1) / max(total_w_cm, total_h_cm))
+
+        framed_img = FrameRenderer.render_framed_artwork(
+            artwork_image,
+            width_cm,
+            height_cm,
+            frame_config,
+            scale
+        )
+
+        # Pixel rounding can still overshoot by a few pixels
+        if framed_img.width > PREVIEW_MAX_SIZE or framed_img.height > PREVIEW_MAX_SIZE:
+            ratio = min(PREVIEW_MAX_SIZE / framed_img.width, PREVIEW_MAX_SIZE / framed_img.height)
+            new_size = (int(framed_img.width * ratio), int(framed_img.height * ratio))
+            framed_img = framed_img.resize(new_size, Image.Resampling.BILINEAR)
+
+        return framed_img
+
     def _apply_frame_config(self):
         """Apply current frame configuration to selected artwork"""
         if not self.selected_artwork:
@@ -451,8 +614,10 @@ class FramingStudioScreen:
             # Apply to artwork
             self.selected_artwork.frame_config = frame_config
 
-            # Update the artwork list to show it's framed
-            self._refresh_artwork_list()
+            # Update the artwork's list button to show it's framed
+            btn = self._artwork_buttons.get(self.selected_artwork.art_id)
+            if btn is not None:
+                btn.configure(text=self._artwork_label(self.selected_artwork))
 
             self.app._show_info("Frame configuration applied!")
 
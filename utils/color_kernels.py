@@ -0,0 +1,95 @@
+"""
+Color Adjustment Kernels
+
+Fused per-pixel kernels used by the art editor's white balance. They are
+only used when numba is installed; without it the editor keeps its
+OpenCV lookup-table path, which is faster than interpreted Python.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def apply_tone_saturation_shift(image: np.ndarray, tone_lut: np.ndarray,
+                                shift_lut: np.ndarray, factor: float) -> np.ndarray:
+    """
+    Apply a tone curve, saturation and per-channel shift in one pass
+
+    Matches cv2.LUT, BGR2GRAY, addWeighted and cv2.LUT run in sequence,
+    to within one level from rounding.
+
+    Args:
+        image: Input image (BGR, uint8)
+        tone_lut: Tone curve shared by all channels (256,)
+        shift_lut: Per-channel shift curves (256, 3)
+        factor: Saturation factor, 1.0 leaves colors unchanged
+
+    Returns:
+        Adjusted image (BGR, uint8)
+    """
+    height, width = image.shape[0], image.shape[1]
+    result = np.empty((height, width, 3), np.uint8)
+    inv = 1.0 - factor
+
+    for y in prange(height):
+        for x in range(width):
+            b = tone_lut[image[y, x, 0]]
+            g = tone_lut[image[y, x, 1]]
+            r = tone_lut[image[y, x, 2]]
+
+            # Same fixed-point weights as OpenCV's BGR2GRAY
+            gray = (int(b) * 1868 + int(g) * 9617 + int(r) * 4899 + 8192) >> 14
+
+            for c in range(3):
+                v = tone_lut[image[y, x, c]]
+                blended = min(255, max(0, int(v * factor + gray * inv + 0.5)))
+                result[y, x, c] = shift_lut[blended, c]
+
+    return result
+
+
+@njit(parallel=True, cache=True)
+def channel_histograms(image: np.ndarray, blocks: int = 64) -> np.ndarray:
+    """
+    Count the levels of all three channels in one pass over the image
+
+    Args:
+        image: Input image (BGR, uint8)
+        blocks: Number of row blocks counted in parallel
+
+    Returns:
+        Histograms of shape (3, 256), one row per channel
+    """
+    height, width = image.shape[0], image.shape[1]
+    rows_per_block = (height + blocks - 1) // blocks
+    partial = np.zeros((blocks, 3, 256), np.int64)
+
+    for block in prange(blocks):
+        for y in range(block * rows_per_block, min(height, (block + 1) * rows_per_block)):
+            for x in range(width):
+                partial[block, 0, image[y, x, 0]] += 1
+                partial[block, 1, image[y, x, 1]] += 1
+                partial[block, 2, image[y, x, 2]] += 1
+
+    return partial.sum(axis=0)
+
+
+def warm_up():
+    """Compile the kernels on a tiny image so the first edit does not pay for it"""
+    if NUMBA_AVAILABLE:
+        apply_tone_saturation_shift(np.zeros((1, 1, 3), np.uint8),
+                                    np.arange(256, dtype=np.uint8),
+                                    np.zeros((256, 3), np.uint8), 1.0)
+        channel_histograms(np.zeros((1, 1, 3), np.uint8))
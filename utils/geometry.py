@@ -0,0 +1,132 @@
+"""
+Layout Geometry Kernels
+
+Small numeric kernels used by the arrangement workspace for aligning and
+distributing placed artwork. They are compiled with numba when it is
+installed and run as plain Python/NumPy otherwise.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Alignment modes
+ALIGN_MIN = 0     # left / top edges
+ALIGN_CENTER = 1  # horizontal / vertical centers
+ALIGN_MAX = 2     # right / bottom edges
+
+
+@njit(cache=True)
+def align_positions(positions: np.ndarray, sizes: np.ndarray, mode: int) -> np.ndarray:
+    """
+    Align items along one axis
+
+    Args:
+        positions: Item start positions (x or y) in cm
+        sizes: Item sizes along the same axis in cm
+        mode: ALIGN_MIN, ALIGN_CENTER or ALIGN_MAX
+
+    Returns:
+        New start positions
+    """
+    if mode == ALIGN_MIN:
+        return np.full(positions.shape[0], positions.min())
+    if mode == ALIGN_MAX:
+        return (positions + sizes).max() - sizes
+    return (positions + sizes / 2).mean() - sizes / 2
+
+
+@njit(cache=True)
+def distribute_positions(positions: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """
+    Distribute items evenly along one axis, keeping the outermost items fixed
+
+    Args:
+        positions: Item start positions (x or y) in cm
+        sizes: Item sizes along the same axis in cm
+
+    Returns:
+        New start positions, in the same order as the input
+    """
+    n = positions.shape[0]
+    order = np.argsort(positions, kind='mergesort')
+    sorted_sizes = sizes[order]
+
+    start = positions[order[0]]
+    end = positions[order[n - 1]] + sorted_sizes[n - 1]
+    gap = (end - start - sorted_sizes.sum()) / (n - 1)
+
+    # Each item starts after the sizes of all items before it plus one gap per item
+    sorted_positions = start + (np.cumsum(sorted_sizes) - sorted_sizes) + gap * np.arange(n)
+
+    result = np.empty(n)
+    result[order] = sorted_positions
+    return result
+
+
+@njit(cache=True)
+def snap_to_guides(position: float, size: float, guides: np.ndarray, tolerance: float) -> float:
+    """
+    Snap an item's start, center or end to the nearest guide within tolerance
+
+    Args:
+        position: Item start position (x or y) in cm
+        size: Item size along the same axis in cm
+        guides: Guide positions along the same axis in cm
+        tolerance: Maximum snap distance in cm
+
+    Returns:
+        Snapped start position, or the original position if no guide is close enough
+    """
+    if guides.shape[0] == 0:
+        return position
+
+    offsets = np.array([0.0, size / 2, size])
+    diff = guides.reshape(-1, 1) - (position + offsets).reshape(1, -1)
+    best = np.argmin(np.abs(diff))
+    guide_idx, offset_idx = best // 3, best % 3
+
+    if abs(diff[guide_idx, offset_idx]) < tolerance:
+        return guides[guide_idx] - offsets[offset_idx]
+    return position
+
+
+@njit(cache=True)
+def snap_clamp_batch(xs: np.ndarray, ys: np.ndarray, ws: np.ndarray, hs: np.ndarray,
+                     guide_h: np.ndarray, guide_v: np.ndarray,
+                     wall_w: float, wall_h: float, grid_size: float, tol: float,
+                     snap_grid: bool, snap_guides: bool):
+    """
+    Snap and clamp a batch of items in place
+
+    Args:
+        xs, ys: Item top-left positions in cm (modified in place)
+        ws, hs: Item sizes in cm
+        guide_h, guide_v: Horizontal and vertical guide positions in cm
+        wall_w, wall_h: Wall size in cm
+        grid_size: Grid spacing in cm
+        tol: Guide snap tolerance in cm
+        snap_grid: Snap positions to the grid
+        snap_guides: Snap edges and centers to guides
+    """
+    for i in range(xs.shape[0]):
+        x = xs[i]
+        y = ys[i]
+
+        if snap_grid:
+            x = round(x / grid_size) * grid_size
+            y = round(y / grid_size) * grid_size
+
+        if snap_guides:
+            y = snap_to_guides(y, hs[i], guide_h, tol)
+            x = snap_to_guides(x, ws[i], guide_v, tol)
+
+        xs[i] = max(0.0, min(x, wall_w - ws[i]))
+        ys[i] = max(0.0, min(y, wall_h - hs[i]))
@@ -3,8 +3,45 @@ Perspective Correction Utilities
 """
 import numpy as np
 import cv2
+from functools import lru_cache
 from typing import List, Tuple
 
+# Outputs at least this large on either side are warped on the GPU when CUDA is available
+GPU_WARP_MIN_SIZE = 2000
+
+_cuda_available = None  # Detected on first use
+
+
+def _has_cuda() -> bool:
+    """Check once whether OpenCV was built with CUDA and a device is present"""
+    global _cuda_available
+    if _cuda_available is None:
+        try:
+            _cuda_available = cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except (AttributeError, cv2.error):
+            _cuda_available = False
+    return _cuda_available
+
+
+def _warp_perspective_gpu(image: np.ndarray, matrix: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+    """
+    Warp an image on the GPU
+
+    CUDA has no Lanczos warp, so bicubic is the closest available filter.
+
+    Args:
+        image: Input image as numpy array
+        matrix: 3x3 perspective transform
+        size: Output (width, height)
+
+    Returns:
+        Warped image as numpy array
+    """
+    gpu_src = cv2.cuda_GpuMat()
+    gpu_src.upload(image)
+    gpu_dst = cv2.cuda.warpPerspective(gpu_src, matrix, size, flags=cv2.INTER_CUBIC)
+    return gpu_dst.download()
+
 
 def apply_perspective_correction_full_image(
     image: np.ndarray,
@@ -124,9 +161,74 @@ def apply_perspective_correction(
     Returns:
         Corrected image as numpy array
     """
+    matrix = _perspective_matrix(corner_points, output_width, output_height)
+
+    # Large outputs go to the GPU when possible, falling back to the CPU on any CUDA error
+    if max(output_width, output_height) >= GPU_WARP_MIN_SIZE and _has_cuda():
+        try:
+            return _warp_perspective_gpu(image, matrix, (output_width, output_height))
+        except cv2.error as e:
+            print(f"Error warping on GPU, using CPU: {e}")
+
+    # Apply perspective warp
+    corrected = cv2.warpPerspective(
+        image,
+        matrix,
+        (output_width, output_height),
+        flags=cv2.INTER_LANCZOS4
+    )
+
+    return corrected
+
+
+def perspective_maps(
+    corner_points: List[Tuple[float, float]],
+    output_width: int,
+    output_height: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build remap tables for the warp done by apply_perspective_correction
+
+    The tables can be reused with cv2.remap while the corners stay the same.
+    They are fixed-point (CV_16SC2) and meant for bilinear previews.
+
+    Args:
+        corner_points: List of 4 (x, y) tuples representing corners
+                      Order: top-left, top-right, bottom-right, bottom-left
+        output_width: Desired output width in pixels
+        output_height: Desired output height in pixels
+
+    Returns:
+        (map1, map2) tuple for cv2.remap
+    """
+    matrix = _perspective_matrix(corner_points, output_width, output_height)
+
+    # With identity camera matrices and no distortion, each output pixel maps back through the homography
+    identity = np.eye(3)
+    return cv2.initUndistortRectifyMap(identity, None, matrix, identity,
+                                       (output_width, output_height), cv2.CV_16SC2)
+
+
+def _perspective_matrix(
+    corner_points: List[Tuple[float, float]],
+    output_width: int,
+    output_height: int
+) -> np.ndarray:
+    """Get the transform mapping the corner points onto an output_width x output_height rectangle"""
     if len(corner_points) != 4:
         raise ValueError("Exactly 4 corner points required for perspective correction")
 
+    key = tuple((float(x), float(y)) for x, y in corner_points)
+    return _cached_perspective_matrix(key, output_width, output_height)
+
+
+@lru_cache(maxsize=16)
+def _cached_perspective_matrix(
+    corner_points: Tuple[Tuple[float, float], ...],
+    output_width: int,
+    output_height: int
+) -> np.ndarray:
+    """Solve the perspective transform, reused until the corners or output size change"""
     # Convert corner points to numpy array
     src_points = np.float32(corner_points)
 
@@ -138,18 +240,10 @@ def apply_perspective_correction(
         [0, output_height - 1]
     ])
 
-    # Calculate perspective transform matrix
+    # Calculate perspective transform matrix, read-only since it is shared between calls
     matrix = cv2.getPerspectiveTransform(src_points, dst_points)
-
-    # Apply perspective warp
-    corrected = cv2.warpPerspective(
-        image,
-        matrix,
-        (output_width, output_height),
-        flags=cv2.INTER_LANCZOS4
-    )
-
-    return corrected
+    matrix.flags.writeable = False
+    return matrix
 
 
 def order_points(points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
@@ -0,0 +1,75 @@
+"""
+Spatial Index for Hit-Testing
+"""
+from typing import Any, List, Tuple
+
+
+class QuadTree:
+    """Quadtree over axis-aligned boxes, queried by point"""
+
+    def __init__(self, x0: float, y0: float, x1: float, y1: float,
+                 capacity: int = 8, max_depth: int = 8):
+        """
+        Initialize quadtree node
+
+        Args:
+            x0, y0, x1, y1: Bounds covered by this node
+            capacity: Number of boxes a leaf holds before splitting
+            max_depth: Maximum subdivision depth below this node
+        """
+        self.bounds = (x0, y0, x1, y1)
+        self.capacity = capacity
+        self.max_depth = max_depth
+        self.items: List[Tuple[Any, float, float, float, float]] = []
+        self.children: List['QuadTree'] = []
+
+    def insert(self, item: Any, x0: float, y0: float, x1: float, y1: float):
+        """Insert an item with its bounding box"""
+        if self.children:
+            child = self._child_containing(x0, y0, x1, y1)
+            if child:
+                child.insert(item, x0, y0, x1, y1)
+                return
+
+        self.items.append((item, x0, y0, x1, y1))
+
+        if not self.children and len(self.items) > self.capacity and self.max_depth > 0:
+            self._split()
+
+    def query_point(self, x: float, y: float) -> List[Any]:
+        """Get all items whose box contains the point"""
+        found = []
+        for item, x0, y0, x1, y1 in self.items:
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                found.append(item)
+
+        for child in self.children:
+            cx0, cy0, cx1, cy1 = child.bounds
+            if cx0 <= x <= cx1 and cy0 <= y <= cy1:
+                found.extend(child.query_point(x, y))
+
+        return found
+
+    def _split(self):
+        """Subdivide into four children and push down boxes that fit in one"""
+        x0, y0, x1, y1 = self.bounds
+        mx, my = (x0 + x1) / 2, (y0 + y1) / 2
+        depth = self.max_depth - 1
+        self.children = [
+            QuadTree(x0, y0, mx, my, self.capacity, depth),
+            QuadTree(mx, y0, x1, my, self.capacity, depth),
+            QuadTree(x0, my, mx, y1, self.capacity, depth),
+            QuadTree(mx, my, x1, y1, self.capacity, depth),
+        ]
+
+        items, self.items = self.items, []
+        for entry in items:
+            self.insert(*entry)
+
+    def _child_containing(self, x0: float, y0: float, x1: float, y1: float):
+        """Get the child that fully contains a box, or None if it straddles"""
+        for child in self.children:
+            cx0, cy0, cx1, cy1 = child.bounds
+            if cx0 <= x0 and cy0 <= y0 and x1 <= cx1 and y1 <= cy1:
+                return child
+        return None